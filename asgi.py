@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+"""
+ASGI module for Uvicorn deployment
+Serves the Flask app and runs the bot on the same event loop
+"""
+
+import asyncio
+import os
+import sys
+import time
+from dotenv import load_dotenv
+from asgiref.wsgi import WsgiToAsgi
+
+# Load environment variables first
+load_dotenv()
+
+# Add current directory to Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+import webserver
+
+# Flask stays a WSGI app - requests are served from Uvicorn's threadpool
+flask_app = WsgiToAsgi(webserver.app)
+
+# Single bot task for this process (one worker = one Highrise login)
+bot_task = None
+
+async def start_bot():
+    """Start the resilient bot as a task on the server's event loop"""
+    global bot_task
+
+    if bot_task and not bot_task.done():
+        print("⚠️ Bot task already running - skipping duplicate start")
+        return
+
+    try:
+        from connection_resilience import safe_bot_runner, install_sighup_handler
+    except ImportError as e:
+        print(f"❌ ResilientBotManager import failed: {e}")
+        return
+
+    # Let SIGHUP rotate bot credentials for the next reconnect
+    install_sighup_handler(asyncio.get_running_loop())
+
+    print("🚀 Starting SINGLE bot instance via ResilientBotManager")
+    webserver.bot_running = True
+    webserver.bot_start_time = time.time()
+    bot_task = asyncio.create_task(safe_bot_runner())
+    bot_task.add_done_callback(_on_bot_done)
+
+def _on_bot_done(task):
+    """Reset web status once the bot task exits"""
+    webserver.bot_running = False
+    if not task.cancelled() and task.exception():
+        print(f"❌ Bot error: {task.exception()}")
+
+async def stop_bot():
+    """Cancel the bot task on server shutdown"""
+    if bot_task and not bot_task.done():
+        print("🛑 Stopping bot instance...")
+        bot_task.cancel()
+        try:
+            await bot_task
+        except (asyncio.CancelledError, Exception):
+            pass
+
+async def lifespan(receive, send):
+    """Handle ASGI lifespan events (startup/shutdown)"""
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await start_bot()
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await stop_bot()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+async def application(scope, receive, send):
+    """ASGI application object that Uvicorn will use"""
+    if scope["type"] == "lifespan":
+        await lifespan(receive, send)
+    else:
+        await flask_app(scope, receive, send)
+
+app = application
+
+if __name__ == "__main__":
+    # This is for local testing only
+    import uvicorn
+
+    port = int(os.getenv('PORT', 8080))
+    print(f"Running ASGI app with Uvicorn on port {port}")
+    uvicorn.run("asgi:application", host='0.0.0.0', port=port,
+                loop="uvloop", http="httptools", workers=1)
@@ -8,111 +8,114 @@ import asyncio
 import sys
 from typing import List, Dict
 
+_SEPARATOR = "=" * 50
+
+# Check tables (module-level so they are built once, not per call)
+_CHAT_COMMANDS = (
+    "!set", "!equip", "!remove", "!unsub", "!fixdata",
+    "!set event", "!addhost", "!removehost", "!notify",
+    "!start", "!stop", "!clear", "!stats", "!next", "!match",
+    "!help", "!getdata", "!backup"
+)
+
+_WHISPER_COMMANDS = (
+    "POP", "LOVE", "!sub", "help"
+)
+
+# Commands that depend on database
+_DB_DEPENDENT_COMMANDS = (
+    "!set", "!addhost", "!removehost", "!unsub",
+    "!fixdata", "!getdata", "!backup", "POP", "LOVE", "!sub"
+)
+
+_ASYNC_CONCERNS = (
+    "Highrise API calls should have proper exception handling",
+    "Database operations should be wrapped in try-catch blocks",
+    "Long-running operations should not block the event loop",
+    "Whisper/chat responses should handle connection timeouts"
+)
+
+_GUNICORN_CHECKS = (
+    "Bot instance should be properly initialized in worker process",
+    "Database connection should be established per worker",
+    "Event loop should be correctly set up in worker thread",
+    "Memory leaks should be avoided in long-running processes"
+)
+
+_RECOMMENDATIONS = (
+    "Add connection retry logic for database operations",
+    "Implement graceful fallback when database is unavailable",
+    "Add timeout handling for Highrise API calls",
+    "Implement command rate limiting to prevent spam",
+    "Add better error logging for debugging in production"
+)
+
+_ISOLATION_CHECKS = (
+    "Registration sessions should be thread-safe",
+    "Bot state changes should be atomic",
+    "Multiple users should be able to use commands simultaneously",
+    "Command processing should not block other bot functions"
+)
+
+def _emit(lines):
+    """Write a block of report lines with a single stdout write"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 class CommandChecker:
     """Check command reliability in Gunicorn environment"""
     
     def __init__(self):
-        self.chat_commands = [
-            "!set", "!equip", "!remove", "!unsub", "!fixdata", 
-            "!set event", "!addhost", "!removehost", "!notify",
-            "!start", "!stop", "!clear", "!stats", "!next", "!match",
-            "!help", "!getdata", "!backup"
-        ]
-        
-        self.whisper_commands = [
-            "POP", "LOVE", "!sub", "help"
-        ]
-        
+        self.chat_commands = _CHAT_COMMANDS
+        self.whisper_commands = _WHISPER_COMMANDS
         self.potential_issues = []
         
     def check_database_dependencies(self):
         """Check if commands properly handle database connection issues"""
         issues = []
         
-        # Commands that depend on database
-        db_dependent_commands = [
-            "!set", "!addhost", "!removehost", "!unsub", 
-            "!fixdata", "!getdata", "!backup", "POP", "LOVE", "!sub"
-        ]
-        
-        print("Checking database dependency handling...")
-        
-        for cmd in db_dependent_commands:
-            print(f"  ✓ {cmd} - Should check self.db_client.is_connected before database operations")
+        lines = ["Checking database dependency handling..."]
+        lines.extend(f"  ✓ {cmd} - Should check self.db_client.is_connected before database operations"
+                     for cmd in _DB_DEPENDENT_COMMANDS)
+        _emit(lines)
         
         return issues
     
     def check_async_reliability(self):
         """Check if async operations are properly handled"""
-        print("\nChecking async operation reliability...")
-        
-        async_concerns = [
-            "Highrise API calls should have proper exception handling",
-            "Database operations should be wrapped in try-catch blocks",
-            "Long-running operations should not block the event loop",
-            "Whisper/chat responses should handle connection timeouts"
-        ]
-        
-        for concern in async_concerns:
-            print(f"  ⚠️  {concern}")
+        lines = ["\nChecking async operation reliability..."]
+        lines.extend(f"  ⚠️  {concern}" for concern in _ASYNC_CONCERNS)
+        _emit(lines)
         
         return []
     
     def check_gunicorn_specific_issues(self):
         """Check for issues specific to Gunicorn deployment"""
-        print("\nChecking Gunicorn-specific considerations...")
-        
-        gunicorn_checks = [
-            "Bot instance should be properly initialized in worker process",
-            "Database connection should be established per worker",
-            "Event loop should be correctly set up in worker thread",
-            "Memory leaks should be avoided in long-running processes"
-        ]
-        
-        for check in gunicorn_checks:
-            print(f"  ℹ️  {check}")
+        lines = ["\nChecking Gunicorn-specific considerations..."]
+        lines.extend(f"  ℹ️  {check}" for check in _GUNICORN_CHECKS)
+        _emit(lines)
         
         return []
     
     def generate_reliability_fixes(self):
         """Generate fixes to improve command reliability"""
-        fixes = []
+        lines = ["\nRecommended reliability improvements:"]
+        lines.extend(f"  {i}. {rec}" for i, rec in enumerate(_RECOMMENDATIONS, 1))
+        _emit(lines)
         
-        print("\nRecommended reliability improvements:")
-        
-        recommendations = [
-            "Add connection retry logic for database operations",
-            "Implement graceful fallback when database is unavailable", 
-            "Add timeout handling for Highrise API calls",
-            "Implement command rate limiting to prevent spam",
-            "Add better error logging for debugging in production"
-        ]
-        
-        for i, rec in enumerate(recommendations, 1):
-            print(f"  {i}. {rec}")
-        
-        return recommendations
+        return _RECOMMENDATIONS
     
     def check_command_isolation(self):
         """Check that commands don't interfere with each other"""
-        print("\nChecking command isolation...")
-        
-        isolation_checks = [
-            "Registration sessions should be thread-safe",
-            "Bot state changes should be atomic",
-            "Multiple users should be able to use commands simultaneously",
-            "Command processing should not block other bot functions"
-        ]
-        
-        for check in isolation_checks:
-            print(f"  ✓ {check}")
+        lines = ["\nChecking command isolation..."]
+        lines.extend(f"  ✓ {check}" for check in _ISOLATION_CHECKS)
+        _emit(lines)
         
         return []
 
 def main():
     """Run all command reliability checks"""
     print("Bot Command Reliability Checker for Gunicorn")
-    print("=" * 50)
+    print(_SEPARATOR)
     
     checker = CommandChecker()
     
@@ -126,7 +129,7 @@ def main():
     # Generate recommendations
     fixes = checker.generate_reliability_fixes()
     
-    print(f"\n{'=' * 50}")
+    print("\n" + _SEPARATOR)
     if issues:
         print(f"❌ Found {len(issues)} potential issues:")
         for issue in issues:
@@ -1,13 +1,16 @@
 # Match Show Bot Configuration
 # Edit these values to customize your bot
 
+import os
+from functools import lru_cache
+
 # Match Show settings
 MATCH_PROMPT_INTERVAL = 30  # Minutes between public match prompts in room
 BOT_NAME = "Match Show"  # Bot's display name
 
 # Registration settings
 MIN_AGE = 18  # Minimum age for registration
-DEFAULT_HOSTS = ["coolbuoy"]  # Default host usernames
+DEFAULT_HOSTS = ("coolbuoy",)  # Default host usernames
 
 # MongoDB settings (can be overridden by environment variables)
 # For MongoDB Atlas, set MONGODB_URI in your .env file to your connection string
@@ -15,19 +18,36 @@ DEFAULT_HOSTS = ["coolbuoy"]  # Default host usernames
 MONGODB_URI = "mongodb://localhost:27017"  # Default local MongoDB URI (will be overridden by env variable)
 MONGODB_DB_NAME = "MatchShowBot"  # Database name
 
+# Environment lookups, read once per process (call .cache_clear() to re-read)
+@lru_cache(maxsize=1)
+def get_mongodb_uri() -> str:
+    return os.environ.get("MONGODB_URI", MONGODB_URI)
+
+@lru_cache(maxsize=1)
+def get_mongodb_db_name() -> str:
+    return os.environ.get("MONGODB_DB_NAME", MONGODB_DB_NAME)
+
+@lru_cache(maxsize=1)
+def get_room_id() -> str | None:
+    return os.environ.get("ROOM_ID")
+
+@lru_cache(maxsize=1)
+def get_bot_token() -> str | None:
+    return os.environ.get("BOT_TOKEN")
+
 
 
 # Bot responses and prompts
-MATCH_PROMPTS = [
+MATCH_PROMPTS = (
     "Looking for your perfect match? Send 'POP' or 'LOVE' to register for our Match Show! ❤️",
     "The Match Show is coming soon! Send 'POP' to register as a participant! 💞",
     "Looking for love? Send 'LOVE' to join our upcoming Match Show! 💘",
     "Don't miss out on finding your match! Register for the Match Show by sending 'POP' or 'LOVE'! �"
-]
+)
 
 # Event settings
 DEFAULT_EVENT_DATE = "Coming soon"  # Default event date message
-REGISTRATION_FIELDS = ["name", "age", "occupation", "country", "type", "continent"]
-REQUIRED_FIELDS = ["name", "age", "country", "continent"]
+REGISTRATION_FIELDS = ("name", "age", "occupation", "country", "type", "continent")
+REQUIRED_FIELDS = frozenset({"name", "age", "country", "continent"})  # Membership checks only
 
 # Note: ROOM_ID and BOT_TOKEN are now read from environment variables (.env file)
\ No newline at end of file
@@ -4,16 +4,21 @@ Manages Highrise connection lifecycle with proper cleanup
 """
 
 import asyncio
+import logging
 import time
 from typing import Dict, Optional
 from dataclasses import dataclass
 from contextlib import asynccontextmanager
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+CLEANUP_DELAY = 5  # Seconds to wait after a connection exits before cleanup
+
+@dataclass(slots=True)
 class ConnectionState:
     """Track connection state and metadata"""
     connected: bool = False
-    last_connect_time: float = 0
+    last_connect_time: float = float('-inf')  # time.monotonic() of last attempt
     connect_attempts: int = 0
     connection_id: Optional[str] = None
     error_count: int = 0
@@ -22,29 +27,35 @@ class ConnectionPoolManager:
     def __init__(self):
         self.connections: Dict[str, ConnectionState] = {}
         self.connection_lock = asyncio.Lock()
-        self.cleanup_tasks = set()
+        # Aggregate counters kept in step with state changes (O(1) stats)
+        self._active_count = 0  # states with connected=True
+        self._error_count = 0  # states with error_count > 0
+        # Delayed cleanups run on one long-lived reaper task instead of a task each
+        self._cleanup_queue: Optional[asyncio.Queue] = None
+        self._reaper_task: Optional[asyncio.Task] = None
         
-    async def get_connection_state(self, bot_id: str) -> ConnectionState:
+    def get_connection_state(self, bot_id: str) -> ConnectionState:
         """Get or create connection state for bot"""
-        async with self.connection_lock:
-            if bot_id not in self.connections:
-                self.connections[bot_id] = ConnectionState()
-            return self.connections[bot_id]
+        # No lock needed - plain dict ops never yield to the event loop
+        state = self.connections.get(bot_id)
+        if state is None:
+            state = self.connections[bot_id] = ConnectionState()
+        return state
     
     async def can_connect(self, bot_id: str) -> bool:
         """Check if bot can safely connect without conflicts"""
-        state = await self.get_connection_state(bot_id)
+        state = self.get_connection_state(bot_id)
         
         # Prevent rapid reconnection attempts
-        time_since_last = time.time() - state.last_connect_time
+        time_since_last = time.monotonic() - state.last_connect_time
         if time_since_last < 10:  # 10 second cooldown (reduced from 30)
-            print(f"⏳ Connection cooldown active for {bot_id} ({10-time_since_last:.1f}s remaining)")
+            logger.warning("⏳ Connection cooldown active for %s (%.1fs remaining)", bot_id, 10 - time_since_last)
             return False
         
         # Limit connection attempts
         if state.connect_attempts > 3:
             if time_since_last < 120:  # 2 minute penalty (reduced from 5)
-                print(f"🚫 Connection penalty active for {bot_id} (too many attempts)")
+                logger.warning("🚫 Connection penalty active for %s (too many attempts)", bot_id)
                 return False
             else:
                 # Reset attempts after penalty period
@@ -54,35 +65,44 @@ class ConnectionPoolManager:
     
     async def register_connection_attempt(self, bot_id: str):
         """Register a connection attempt"""
-        state = await self.get_connection_state(bot_id)
-        state.last_connect_time = time.time()
+        state = self.get_connection_state(bot_id)
+        state.last_connect_time = time.monotonic()
         state.connect_attempts += 1
         
     async def register_connection_success(self, bot_id: str, connection_id: str):
         """Register successful connection"""
-        state = await self.get_connection_state(bot_id)
+        state = self.get_connection_state(bot_id)
+        if not state.connected:
+            self._active_count += 1
+        if state.error_count:
+            self._error_count -= 1
         state.connected = True
         state.connection_id = connection_id
         state.connect_attempts = 0  # Reset on success
         state.error_count = 0
-        print(f"✅ Connection registered for {bot_id}: {connection_id}")
+        logger.debug("✅ Connection registered for %s: %s", bot_id, connection_id)
     
     async def register_connection_failure(self, bot_id: str, error: str):
         """Register connection failure"""
-        state = await self.get_connection_state(bot_id)
+        state = self.get_connection_state(bot_id)
+        if state.connected:
+            self._active_count -= 1
+        if not state.error_count:
+            self._error_count += 1
         state.connected = False
         state.connection_id = None
         state.error_count += 1
-        print(f"❌ Connection failed for {bot_id}: {error}")
+        logger.warning("❌ Connection failed for %s: %s", bot_id, error)
     
     async def cleanup_connection(self, bot_id: str):
         """Clean up connection state"""
-        async with self.connection_lock:
-            if bot_id in self.connections:
-                state = self.connections[bot_id]
-                state.connected = False
-                state.connection_id = None
-                print(f"🧹 Cleaned up connection for {bot_id}")
+        state = self.connections.get(bot_id)
+        if state is not None:
+            if state.connected:
+                self._active_count -= 1
+            state.connected = False
+            state.connection_id = None
+            logger.debug("🧹 Cleaned up connection for %s", bot_id)
     
     @asynccontextmanager
     async def managed_connection(self, bot_id: str):
@@ -95,7 +115,7 @@ class ConnectionPoolManager:
         try:
             yield
             # Connection successful if we reach here without exception
-            print(f"🔗 Connection context completed successfully for {bot_id}")
+            logger.debug("🔗 Connection context completed successfully for %s", bot_id)
             
         except Exception as e:
             await self.register_connection_failure(bot_id, str(e))
@@ -103,14 +123,27 @@ class ConnectionPoolManager:
         
         finally:
             # Schedule cleanup after a delay
-            cleanup_task = asyncio.create_task(self._delayed_cleanup(bot_id))
-            self.cleanup_tasks.add(cleanup_task)
-            cleanup_task.add_done_callback(self.cleanup_tasks.discard)
+            self._schedule_cleanup(bot_id)
+    
+    def _schedule_cleanup(self, bot_id: str):
+        """Queue a delayed cleanup for the reaper task"""
+        loop = asyncio.get_running_loop()
+        # Start the reaper lazily (the pool is created at import, outside any loop)
+        if (self._reaper_task is None or self._reaper_task.done()
+                or self._reaper_task.get_loop() is not loop):
+            self._cleanup_queue = asyncio.Queue()
+            self._reaper_task = loop.create_task(self._reaper(self._cleanup_queue))
+        self._cleanup_queue.put_nowait((time.monotonic() + CLEANUP_DELAY, bot_id))
     
-    async def _delayed_cleanup(self, bot_id: str):
-        """Delayed connection cleanup"""
-        await asyncio.sleep(5)  # Wait before cleanup
-        await self.cleanup_connection(bot_id)
+    async def _reaper(self, queue: asyncio.Queue):
+        """Run queued cleanups once their deadline has passed"""
+        # Every entry uses the same delay, so FIFO order is deadline order
+        while True:
+            deadline, bot_id = await queue.get()
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await self.cleanup_connection(bot_id)
     
     async def force_cleanup_all(self):
         """Force cleanup all connections"""
@@ -118,28 +151,32 @@ class ConnectionPoolManager:
             for bot_id in list(self.connections.keys()):
                 await self.cleanup_connection(bot_id)
             
-            # Cancel all cleanup tasks
-            for task in list(self.cleanup_tasks):
-                task.cancel()
-            self.cleanup_tasks.clear()
+            # Stop the reaper - every connection is already cleaned up
+            if self._reaper_task:
+                self._reaper_task.cancel()
+            self._reaper_task = None
+            self._cleanup_queue = None
             
-            print("🧹 Force cleaned all connections")
+            logger.debug("🧹 Force cleaned all connections")
     
     def get_connection_stats(self) -> Dict:
         """Get connection statistics"""
+        now = time.monotonic()
         stats = {
             'total_connections': len(self.connections),
-            'active_connections': sum(1 for state in self.connections.values() if state.connected),
-            'failed_connections': sum(1 for state in self.connections.values() if state.error_count > 0),
+            'active_connections': self._active_count,
+            'failed_connections': self._error_count,
             'connections': {}
         }
         
         for bot_id, state in self.connections.items():
+            # Seconds since last attempt - monotonic readings have no wall-clock meaning
+            last_connect_age = now - state.last_connect_time
             stats['connections'][bot_id] = {
                 'connected': state.connected,
                 'attempts': state.connect_attempts,
                 'errors': state.error_count,
-                'last_connect': state.last_connect_time,
+                'last_connect_age': round(last_connect_age, 1) if last_connect_age != float('inf') else None,
                 'connection_id': state.connection_id
             }
         
@@ -155,6 +192,8 @@ async def safe_highrise_connection(bot_id: str):
         return True
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+    
     # Test the connection pool
     async def test():
         print("Testing connection pool...")
@@ -5,11 +5,21 @@ Prevents TaskGroup errors and handles connection drops gracefully
 import asyncio
 import logging
 import os
+import random
+import signal
 import sys
 from typing import Optional
+from dotenv import dotenv_values
 from highrise import BaseBot, __main__
 from highrise.__main__ import BotDefinition
 from main import Bot
+from config import get_room_id, get_bot_token
+
+try:
+    import uvloop
+except ImportError:
+    # uvloop is optional (not available on Windows) - fall back to asyncio's loop
+    uvloop = None
 
 # Configure logging
 logging.basicConfig(
@@ -18,6 +28,72 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Cleaned (room_id, bot_token), read from the environment once and reused
+_credentials: Optional[tuple[str, str]] = None
+
+# Only these keys are rotated on SIGHUP; everything else keeps the
+# startup precedence (real environment wins over .env)
+CREDENTIAL_KEYS = ("ROOM_ID", "BOT_TOKEN")
+
+def refresh_credentials() -> tuple[str, str]:
+    """Re-read and validate bot credentials from the environment"""
+    global _credentials
+    get_room_id.cache_clear()
+    get_bot_token.cache_clear()
+    room_id = get_room_id()
+    bot_token = get_bot_token()
+    
+    if not room_id or not bot_token:
+        raise ValueError("Missing ROOM_ID or BOT_TOKEN environment variables")
+        
+    # Clean credentials
+    _credentials = (room_id.strip().rstrip('%'), bot_token.strip().rstrip('%'))
+    return _credentials
+
+def reload_credentials_from_dotenv():
+    """Copy rotated ROOM_ID/BOT_TOKEN from .env into the environment"""
+    # A running process's environment never changes from outside, so .env
+    # is the only place rotated credentials can come from
+    env_file = dotenv_values()
+    for key in CREDENTIAL_KEYS:
+        if env_file.get(key):
+            os.environ[key] = env_file[key]
+
+def _handle_sighup(signum=None, frame=None):
+    """Pick up rotated credentials on SIGHUP (used by the next reconnect)"""
+    try:
+        reload_credentials_from_dotenv()
+        refresh_credentials()
+        logger.info("🔑 Credentials reloaded from environment")
+    except ValueError as e:
+        logger.error(f"❌ Credential reload failed: {e}")
+
+def _enable_eager_tasks():
+    """Start new tasks eagerly on the running loop (Python 3.12+ only, no-op before)"""
+    # New tasks run inline up to their first real suspension instead of
+    # waiting a scheduler pass. This changes scheduling for every task on
+    # the loop, so only call it on a loop this module created (see main())
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+def install_sighup_handler(loop: Optional[asyncio.AbstractEventLoop] = None):
+    """Reload credentials on SIGHUP, via the event loop when one is given"""
+    if not hasattr(signal, "SIGHUP"):
+        return  # Windows has no SIGHUP
+    if loop is None:
+        signal.signal(signal.SIGHUP, _handle_sighup)
+        return
+    try:
+        loop.add_signal_handler(signal.SIGHUP, _handle_sighup)
+    except (NotImplementedError, RuntimeError):
+        pass  # Loop can't take signal handlers (e.g. not in the main thread)
+
+def _root_exception(error: BaseException) -> BaseException:
+    """Return the first leaf exception of a (possibly nested) exception group"""
+    while isinstance(error, BaseExceptionGroup) and error.exceptions:
+        error = error.exceptions[0]
+    return error
+
 class ResilientBotManager:
     """Manages bot connection with automatic reconnection and error recovery"""
     
@@ -29,26 +105,37 @@ class ResilientBotManager:
         self.max_reconnect_attempts = 50
         self.base_delay = 5
         self.max_delay = 300
+        self._last_delay = self.base_delay
+        self.multilogin_delay = 2  # Short retry while an old deployment shuts down
+        self.max_multilogin_retries = 30  # Short retries before normal backoff (~1 min)
+        self.multilogin_retries = 0
         self.running = False
+        self._stop_event = asyncio.Event()
+        self._session_task: Optional[asyncio.Task] = None
+    
+    def request_stop(self):
+        """Stop the manager: cancel the live session and skip any reconnect"""
+        logger.info("🛑 Shutdown requested - stopping bot session")
+        self._stop_event.set()
+        if self._session_task and not self._session_task.done():
+            self._session_task.cancel()
+    
+    async def _wait(self, delay: float):
+        """Sleep for delay seconds, waking early if a stop is requested"""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
         
     def get_credentials(self) -> tuple[str, str]:
-        """Get and validate bot credentials"""
-        room_id = os.getenv("ROOM_ID")
-        bot_token = os.getenv("BOT_TOKEN")
-        
-        if not room_id or not bot_token:
-            raise ValueError("Missing ROOM_ID or BOT_TOKEN environment variables")
-            
-        # Clean credentials
-        room_id = room_id.strip().rstrip('%')
-        bot_token = bot_token.strip().rstrip('%')
-        
-        return room_id, bot_token
+        """Get and validate bot credentials (cached after the first read)"""
+        return _credentials or refresh_credentials()
     
     def calculate_delay(self) -> float:
-        """Calculate exponential backoff delay"""
-        delay = min(self.base_delay * (2 ** self.reconnect_attempts), self.max_delay)
-        return delay
+        """Calculate backoff delay using decorrelated jitter"""
+        # Randomized growth spreads reconnects so restarted bots don't retry in lockstep
+        self._last_delay = min(self.max_delay, random.uniform(self.base_delay, self._last_delay * 3))
+        return self._last_delay
     
     async def create_bot_session(self) -> bool:
         """Create a new bot session with connection"""
@@ -66,61 +153,85 @@ class ResilientBotManager:
             except Exception as e:
                 logger.warning(f"Could not store bot instance globally: {e}")
             
-            # Create bot definition
+            # Create bot definition (cached credentials, refreshed on SIGHUP)
+            self.room_id, self.bot_token = self.get_credentials()
             definitions = [BotDefinition(self.bot_instance, self.room_id, self.bot_token)]
-            
-            # Start bot - this should block indefinitely until disconnect
-            logger.info("🔌 Connecting to Highrise...")
-            bot_task = asyncio.create_task(__main__.main(definitions))
-            
-            # Wait for bot to connect and run
-            await bot_task
-            
-            # If we reach here, bot disconnected (might be multilogin or server disconnect)
-            logger.warning("⚠️ Bot disconnected - connection ended unexpectedly")
-            return False  # Force reconnection attempt
-            
-        except asyncio.CancelledError:
-            logger.info("Bot session cancelled")
-            return False
         except Exception as e:
-            logger.error(f"Bot session error: {e}")
+            logger.error(f"Bot session setup error: {e}")
             return False
+        
+        # Start bot - this should block indefinitely until disconnect.
+        # The TaskGroup carries cancellation into the Highrise session and
+        # reports its failures as an ExceptionGroup we can unwrap.
+        logger.info("🔌 Connecting to Highrise...")
+        session_error = None
+        try:
+            async with asyncio.TaskGroup() as tg:
+                self._session_task = tg.create_task(__main__.main(definitions))
+        except* Exception as eg:
+            session_error = _root_exception(eg)
+        finally:
+            self._session_task = None
+        
+        if self._stop_event.is_set():
+            logger.info("👋 Bot session stopped on request")
+            return False
+        
+        if session_error is not None:
+            logger.error(f"Bot session error: {session_error}")
+            # The session got into the room, so start the backoff over
+            if self.bot_instance.bot_status:
+                self.reconnect_attempts = 0
+                self.multilogin_retries = 0
+                self._last_delay = self.base_delay
+            # Let run_with_resilience classify the real cause and back off
+            raise session_error
+        
+        # If we reach here, bot disconnected (might be multilogin or server disconnect)
+        logger.warning("⚠️ Bot disconnected - connection ended unexpectedly")
+        return False  # Force reconnection attempt
     
     async def handle_connection_error(self, error: Exception):
         """Handle connection errors with appropriate recovery"""
         error_str = str(error).lower()
         
-        if "taskgroup" in error_str or "unhandled errors" in error_str:
-            logger.warning("🔄 TaskGroup error detected - connection issue")
-        elif "multilogin" in error_str:
+        if "multilogin" in error_str and self.multilogin_retries < self.max_multilogin_retries:
+            # An old deployment still holds the login - probe again shortly
+            # instead of stalling every startup up front. These short probes
+            # don't count against max_reconnect_attempts; once they run out,
+            # multilogin falls through to the normal (counted) backoff.
+            self.multilogin_retries += 1
             logger.warning("🔄 Multilogin connection closed - reconnecting")
-        elif "connection" in error_str:
+            logger.info(f"⏳ Waiting {self.multilogin_delay}s before reconnection attempt...")
+            await self._wait(self.multilogin_delay)
+            return
+        
+        self.reconnect_attempts += 1
+        if "multilogin" in error_str:
+            logger.warning("🔄 Multilogin persists - backing off")
+        elif "taskgroup" in error_str or "unhandled errors" in error_str:
+            logger.warning("🔄 TaskGroup error detected - connection issue")
+        elif isinstance(error, (ConnectionError, OSError)) or "connection" in error_str:
             logger.warning("🔄 Connection error - attempting recovery")
         else:
             logger.error(f"❌ Unexpected error: {error}")
         
         # Calculate delay
         delay = self.calculate_delay()
-        logger.info(f"⏳ Waiting {delay}s before reconnection attempt...")
-        await asyncio.sleep(delay)
+        logger.info(f"⏳ Waiting {delay:.1f}s before reconnection attempt...")
+        await self._wait(delay)
     
     async def run_with_resilience(self):
         """Main resilient bot runner"""
         self.running = True
         logger.info("🚀 Starting Resilient Bot Manager")
         
-        # CRITICAL: Force cleanup any stale connections from previous deployments
-        logger.info("🧹 Cleaning up any stale connections from previous deployments...")
-        await asyncio.sleep(5)  # Wait 5 seconds for old deployments to fully shut down
-        logger.info("✅ Cleanup wait complete - starting fresh connection")
-        
         try:
             # Get credentials once
             self.room_id, self.bot_token = self.get_credentials()
             logger.info(f"🎯 Target room: {self.room_id}")
             
-            while self.running and self.reconnect_attempts < self.max_reconnect_attempts:
+            while not self._stop_event.is_set() and self.reconnect_attempts < self.max_reconnect_attempts:
                 try:
                     logger.info(f"🔗 Connection attempt {self.reconnect_attempts + 1}/{self.max_reconnect_attempts}")
                     
@@ -129,13 +240,17 @@ class ResilientBotManager:
                     success = await self.create_bot_session()
                     
                     # If we reach here, the bot disconnected (not an error, but needs reconnect)
+                    if self._stop_event.is_set():
+                        break
                     if not success:
                         logger.warning("🔄 Bot disconnected - preparing to reconnect...")
-                        await asyncio.sleep(10)  # Wait before reconnecting
+                        await self._wait(10)  # Wait before reconnecting
                     else:
                         # Should not reach here, but handle it anyway
                         logger.info("✅ Bot session completed normally")
                         self.reconnect_attempts = 0  # Reset on success
+                        self.multilogin_retries = 0
+                        self._last_delay = self.base_delay
                         
                 except KeyboardInterrupt:
                     logger.info("👋 Shutdown requested by user")
@@ -144,7 +259,7 @@ class ResilientBotManager:
                     logger.info("👋 Bot operation cancelled")
                     break
                 except Exception as e:
-                    self.reconnect_attempts += 1
+                    # Counts the attempt unless it was a short multilogin retry
                     await self.handle_connection_error(e)
                     
                     if self.reconnect_attempts >= self.max_reconnect_attempts:
@@ -158,10 +273,19 @@ class ResilientBotManager:
             logger.info("🛑 Resilient Bot Manager stopped")
 
 # Enhanced safe wrapper for TaskGroup compatibility
-async def safe_bot_runner():
+async def safe_bot_runner(install_signal_handlers: bool = False):
     """Safe bot runner that prevents TaskGroup errors"""
     manager = ResilientBotManager()
     
+    # Standalone runs own SIGTERM/SIGINT; under a server (Uvicorn) the server does
+    if install_signal_handlers:
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, manager.request_stop)
+            except NotImplementedError:
+                pass  # Windows event loops don't support signal handlers
+    
     try:
         await manager.run_with_resilience()
     except KeyboardInterrupt:
@@ -170,21 +294,22 @@ async def safe_bot_runner():
         logger.error(f"❌ Safe runner error: {e}")
         sys.exit(1)
 
+async def _run_standalone():
+    """Run the bot on the loop main() created for it"""
+    _enable_eager_tasks()
+    await safe_bot_runner(install_signal_handlers=True)
+
 def main():
-    """Main entry point with proper event loop handling"""
+    """Main entry point - runs the bot on a fresh event loop"""
     try:
-        # Ensure clean event loop
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
+        # Reload credentials on SIGHUP where the platform supports it
+        install_sighup_handler()
         
-        if loop and loop.is_running():
-            # If loop is running, create task
-            asyncio.create_task(safe_bot_runner())
-        else:
-            # Create new event loop
-            asyncio.run(safe_bot_runner())
+        # Create new event loop (uvloop when available).
+        # Callers already inside a loop should `await safe_bot_runner()` instead.
+        if uvloop:
+            uvloop.install()
+        asyncio.run(_run_standalone())
             
     except KeyboardInterrupt:
         logger.info("👋 Program terminated by user")
@@ -4,23 +4,75 @@ Initialize MongoDB collections and indexes.
 
 import asyncio
 import logging
+import random
+from typing import Optional
 from db.mongo_client import MongoDBClient
 
 logger = logging.getLogger(__name__)
 logger.disabled = True  # Disable this logger completely
 
+# Retry transient connection failures (DNS/Atlas blips) before falling back
+MAX_CONNECT_ATTEMPTS = 5
+MAX_RETRY_DELAY = 30  # seconds
+
+# Connected client shared by every initialize_db() caller on the same event loop
+_client: Optional[MongoDBClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def reset_client():
+    """Forget the cached client so the next initialize_db() call reconnects"""
+    global _client, _client_loop
+    _client = None
+    _client_loop = None
+
+def ping_shared_client(timeout: float = 5) -> bool:
+    """Ping the shared client from another thread (e.g. a Flask request handler)"""
+    client, loop = _client, _client_loop
+    if client is None or loop is None or loop.is_closed():
+        return False
+    
+    # The client only works on its own loop - hand the ping over to it
+    future = asyncio.run_coroutine_threadsafe(client.ping(), loop)
+    try:
+        return future.result(timeout)
+    except Exception:
+        future.cancel()
+        return False
+
 async def initialize_db():
     """Initialize MongoDB connection and collections"""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    
+    # Reuse the cached client (and its connection pool) while it is healthy.
+    # Async clients are bound to their event loop, so other loops get their own.
+    if _client is not None and _client_loop is loop:
+        if await _client.ping():
+            return _client
+        logger.warning("Cached MongoDB client failed ping, reconnecting")
+        await _client.disconnect()
+        reset_client()
+    
     # Create MongoDB client
     mongo_client = MongoDBClient()
     
-    # Try to connect
-    connected = await mongo_client.connect()
-    
-    if not connected:
+    # Try to connect, backing off with full jitter between attempts
+    for attempt in range(MAX_CONNECT_ATTEMPTS):
+        if await mongo_client.connect():
+            break
+        await mongo_client.disconnect()
+        if attempt < MAX_CONNECT_ATTEMPTS - 1:
+            delay = random.uniform(0, min(2 ** attempt, MAX_RETRY_DELAY))
+            logger.warning(f"MongoDB connect attempt {attempt + 1} failed, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    else:
         logger.error("Failed to connect to MongoDB. Using local file storage as fallback.")
         return None
     
+    if _client is None:
+        _client = mongo_client
+        _client_loop = loop
+    
     logger.info("Successfully connected to MongoDB")
     return mongo_client
 
@@ -34,4 +86,4 @@ if __name__ == "__main__":
         else:
             print("Connection failed!")
     
-    asyncio.run(test_connection())
\ No newline at end of file
+    asyncio.run(test_connection())
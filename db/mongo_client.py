@@ -3,26 +3,101 @@ MongoDB client for the Match Show bot.
 Handles all database operations and connection management.
 """
 
-import os
 import asyncio
-import copy
 import logging
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient, ReturnDocument, UpdateOne
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
 from datetime import datetime
 from typing import Dict, List, Optional, Union, Any
+from urllib.parse import urlsplit
 
-from config import MONGODB_URI, MONGODB_DB_NAME
+from config import get_mongodb_uri, get_mongodb_db_name
 
 logger = logging.getLogger(__name__)
 logger.disabled = True  # Disable this logger completely
 
+# Case-insensitive string comparison (strength 2 ignores case, not accents)
+CASE_INSENSITIVE = {"locale": "en", "strength": 2}
+
+# Registration session keys that never belong in the stored document
+UNSAVED_REGISTRATION_FIELDS = frozenset({"data", "step", "_debug"})
+
+# (collection, keys, options) for every index the bot relies on
+INDEXES = (
+    ("users", [("user_id", 1)], {"unique": True}),
+    ("profiles", [("user_id", 1)], {"unique": True}),
+    ("matches", [("user1_id", 1), ("user2_id", 1)], {"unique": True}),
+    # Equality-Sort-Range order: each $or branch of get_recent_matches
+    # (matched=True) and can_request_match (matched $in [True, False]) is
+    # served in last_matched order without an in-memory sort
+    ("matches", [("user1_id", 1), ("matched", 1), ("last_matched", -1)], {}),
+    ("matches", [("user2_id", 1), ("matched", 1), ("last_matched", -1)], {}),
+    ("registrations", [("user_id", 1)], {"unique": True}),
+    # Equality on completed/type first, then the registration_time sort
+    ("registrations", [("completed", 1), ("registration_type", 1), ("registration_time", -1)], {}),
+    # Location filters compare case-insensitively, so these indexes share that collation
+    ("registrations", [("completed", 1), ("country", 1)], {"collation": CASE_INSENSITIVE}),
+    ("registrations", [("completed", 1), ("continent", 1)], {"collation": CASE_INSENSITIVE}),
+)
+
+def _mask_uri(uri: str) -> str:
+    """Hide the password in a MongoDB URI so it can be printed"""
+    parsed = urlsplit(uri)
+    credentials, at, hosts = parsed.netloc.rpartition("@")
+    if not at or ":" not in credentials:
+        return uri
+    username = credentials.partition(":")[0]
+    return parsed._replace(netloc=f"{username}:****@{hosts}").geturl()
+
+def _index_name(keys) -> str:
+    """Default name MongoDB gives an index on these keys"""
+    return "_".join(f"{field}_{direction}" for field, direction in keys)
+
+def _potential_matches_pipeline(user_id: str, limit: int) -> list:
+    """Aggregation over profiles returning the user's potential matches"""
+    # One round trip: start from the user's own profile and join the
+    # candidates server-side (no profile -> no documents -> [])
+    return [
+        {"$match": {"user_id": user_id}},
+        {"$limit": 1},
+        {"$lookup": {
+            "from": "profiles",
+            # A missing gender means "any"; an explicit null is kept, as before
+            "let": {"gender": {"$cond": [
+                {"$eq": [{"$type": "$gender"}, "missing"]}, "any", "$gender"
+            ]}},
+            "pipeline": [
+                # Exclude the user themselves and match compatibility criteria
+                # (simplified for now). looking_for may be a single value or
+                # a list, so compare it as a list, like a query $in would
+                {"$match": {"$expr": {"$and": [
+                    {"$ne": ["$user_id", user_id]},
+                    {"$gt": [{"$size": {"$setIntersection": [
+                        {"$cond": [
+                            {"$isArray": "$looking_for"},
+                            "$looking_for",
+                            [{"$ifNull": ["$looking_for", None]}]
+                        ]},
+                        ["$$gender", "any"]
+                    ]}}, 0]}
+                ]}}},
+                # Sort by most compatible (this logic can be expanded)
+                {"$sort": {"last_active": -1}},
+                {"$limit": limit}
+            ],
+            "as": "matches"
+        }},
+        # Return the candidate profiles themselves
+        {"$unwind": "$matches"},
+        {"$replaceRoot": {"newRoot": "$matches"}}
+    ]
+
 class MongoDBClient:
     def __init__(self):
         """Initialize the MongoDB client with URI from environment or config"""
         # Get MongoDB URI from environment or config
-        self.uri = os.getenv("MONGODB_URI", MONGODB_URI)
-        self.db_name = os.getenv("MONGODB_DB_NAME", MONGODB_DB_NAME)
+        self.uri = get_mongodb_uri()
+        self.db_name = get_mongodb_db_name()
         self.client = None
         self.db = None
         self.is_connected = False
@@ -30,32 +105,17 @@ class MongoDBClient:
     async def connect(self) -> bool:
         """Connect to MongoDB and initialize collections"""
         try:
-            # Print status information without exposing credentials
-            masked_uri = self.uri
-            if "://" in masked_uri and "@" in masked_uri:
-                parts = masked_uri.split("@")
-                auth_part = parts[0].split("://")[1].split(":")
-                if len(auth_part) > 1:
-                    masked_uri = f"{parts[0].split('://')[0]}://{auth_part[0]}:****@{parts[1]}"
-            
-            print(f"Connecting to MongoDB at: {masked_uri}")
-            print(f"Database name: {self.db_name}")
-            
-            # Create motor client
-            self.client = AsyncIOMotorClient(self.uri, serverSelectionTimeoutMS=10000)
+            # Create native asyncio client (no executor hop per operation, unlike Motor)
+            self.client = AsyncMongoClient(self.uri, serverSelectionTimeoutMS=10000)
             
             # Check connection
-            print("Testing MongoDB server connection...")
             await self.client.server_info()
             
             # Get database
             self.db = self.client[self.db_name]
             self.is_connected = True
-            print(f"Connected to MongoDB database: {self.db_name}")
-            logger.info(f"Connected to MongoDB database: {self.db_name}")
             
             # Initialize collections
-            print("Initializing collections...")
             self.users = self.db.users
             self.matches = self.db.matches
             self.profiles = self.db.profiles
@@ -65,58 +125,90 @@ class MongoDBClient:
             self.subscribers = self.db.subscribers
             
             # Create indexes
-            print("Creating database indexes...")
-            await self.users.create_index("user_id", unique=True)
-            await self.profiles.create_index("user_id", unique=True)
-            await self.matches.create_index([("user1_id", 1), ("user2_id", 1)], unique=True)
-            await self.registrations.create_index("user_id", unique=True)
+            await self.ensure_indexes()
             
-            print("MongoDB setup complete")
+            # One status line once setup is done (stdout writes block the loop)
+            status = f"Connected to MongoDB at {_mask_uri(self.uri)} (db={self.db_name}, indexes ok)"
+            print(status)
+            logger.info(status)
             return True
         
         except (ConnectionFailure, ServerSelectionTimeoutError) as e:
             self.is_connected = False
-            print(f"Failed to connect to MongoDB: {str(e)}")
-            logger.error(f"Failed to connect to MongoDB: {str(e)}")
+            status = f"Failed to connect to MongoDB at {_mask_uri(self.uri)}: {str(e)}"
+            logger.error(status)
             
             # Add troubleshooting info
             if "timed out" in str(e) or "ServerSelectionTimeoutError" in str(e):
-                print("MongoDB connection timed out. Possible causes:")
-                print("- Network connectivity issues")
-                print("- MongoDB server not running or accessible")
-                print("- IP address not whitelisted in MongoDB Atlas")
-                print("- Incorrect connection string")
+                status += (
+                    "\nMongoDB connection timed out. Possible causes:"
+                    "\n- Network connectivity issues"
+                    "\n- MongoDB server not running or accessible"
+                    "\n- IP address not whitelisted in MongoDB Atlas"
+                    "\n- Incorrect connection string"
+                )
+            print(status)
             
             return False
     
+    async def ensure_indexes(self):
+        """Create any missing indexes (warm restarts only list the existing ones)"""
+        collections = sorted({name for name, _, _ in INDEXES})
+        infos = await asyncio.gather(*(self.db[name].index_information() for name in collections))
+        existing = dict(zip(collections, infos))
+        
+        # Independent collections - build the missing indexes concurrently
+        missing = [
+            self.db[name].create_index(keys, **options)
+            for name, keys, options in INDEXES
+            if _index_name(keys) not in existing[name]
+        ]
+        if missing:
+            await asyncio.gather(*missing)
+    
     async def disconnect(self):
         """Disconnect from MongoDB"""
         if self.client:
-            self.client.close()
+            await self.client.close()
             self.is_connected = False
             logger.info("Disconnected from MongoDB")
     
-    async def save_user(self, user_id: str, username: str) -> bool:
-        """Save or update a user in the database"""
+    async def ping(self) -> bool:
+        """Check that the MongoDB server is still reachable"""
+        if not self.client or not self.is_connected:
+            return False
+        try:
+            await self.client.admin.command("ping")
+            return True
+        except Exception as e:
+            self.is_connected = False
+            logger.warning(f"MongoDB ping failed: {str(e)}")
+            return False
+    
+    async def save_user(self, user_id: str, username: str) -> Optional[Dict]:
+        """Save or update a user and return the saved user (None on failure)"""
+        now = datetime.now()  # One timestamp for every field this write sets
         try:
-            await self.users.update_one(
+            # Upsert and read back in one round trip
+            return await self.users.find_one_and_update(
                 {"user_id": user_id},
                 {
                     "$set": {
                         "username": username,
-                        "last_seen": datetime.now()
+                        "last_seen": now
                     },
                     "$setOnInsert": {
-                        "joined_date": datetime.now(),
+                        "joined_date": now,
                         "match_count": 0
                     }
                 },
-                upsert=True
+                projection={"user_id": 1, "username": 1, "match_count": 1, "_id": 0},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
             )
-            return True
         except Exception as e:
             logger.error(f"Error saving user {user_id}: {str(e)}")
-            return False
+            return None
     
     async def get_user_profile(self, user_id: str) -> Optional[Dict]:
         """Get a user's matchmaking profile"""
@@ -128,14 +220,15 @@ class MongoDBClient:
     
     async def save_user_profile(self, user_id: str, profile_data: Dict) -> bool:
         """Save or update a user's matchmaking profile"""
+        now = datetime.now()
         try:
-            profile_data["updated_at"] = datetime.now()
+            profile_data["updated_at"] = now
             await self.profiles.update_one(
                 {"user_id": user_id},
                 {
                     "$set": profile_data,
                     "$setOnInsert": {
-                        "created_at": datetime.now()
+                        "created_at": now
                     }
                 },
                 upsert=True
@@ -148,35 +241,35 @@ class MongoDBClient:
     async def record_match_attempt(self, user1_id: str, user2_id: str, 
                                   compatibility_score: float, matched: bool) -> bool:
         """Record a match attempt between two users"""
+        now = datetime.now()
         try:
             # Sort IDs to ensure consistency in document keys
             users = sorted([user1_id, user2_id])
             
-            await self.matches.update_one(
+            record_match = self.matches.update_one(
                 {"user1_id": users[0], "user2_id": users[1]},
                 {
                     "$set": {
-                        "last_matched": datetime.now(),
+                        "last_matched": now,
                         "compatibility_score": compatibility_score,
                         "matched": matched
                     },
                     "$inc": {"match_attempts": 1},
                     "$setOnInsert": {
-                        "first_matched": datetime.now()
+                        "first_matched": now
                     }
                 },
                 upsert=True
             )
             
-            # Update match counts for both users
-            await self.users.update_one(
-                {"user_id": user1_id},
-                {"$inc": {"match_count": 1}}
-            )
-            await self.users.update_one(
-                {"user_id": user2_id},
-                {"$inc": {"match_count": 1}}
-            )
+            # Update match counts for both users in one unordered batch
+            update_counts = self.users.bulk_write([
+                UpdateOne({"user_id": user1_id}, {"$inc": {"match_count": 1}}),
+                UpdateOne({"user_id": user2_id}, {"$inc": {"match_count": 1}})
+            ], ordered=False)
+            
+            # The two collections are independent - write them concurrently
+            await asyncio.gather(record_match, update_counts)
             
             return True
         except Exception as e:
@@ -187,19 +280,17 @@ class MongoDBClient:
         """Get a user's recent matches"""
         try:
             # Find matches where user is either user1 or user2
-            matches = []
             cursor = self.matches.find({
                 "$or": [
                     {"user1_id": user_id},
                     {"user2_id": user_id}
                 ],
                 "matched": True
-            }).sort("last_matched", -1).limit(limit)
+            }).sort("last_matched", -1).limit(limit).batch_size(limit)
             
-            async for match in cursor:
-                matches.append(match)
-            
-            return matches
+            # Fetch the whole batch at once instead of one document per await
+            # (batch_size == limit: the first reply carries every result, no getMore)
+            return await cursor.to_list(length=limit)
         except Exception as e:
             logger.error(f"Error getting matches for {user_id}: {str(e)}")
             return []
@@ -207,9 +298,15 @@ class MongoDBClient:
     async def can_request_match(self, user_id: str, cooldown_minutes: int) -> bool:
         """Check if user can request a new match (based on cooldown)"""
         try:
-            # Find most recent match attempt
+            # Find most recent match attempt. record_match_attempt always sets
+            # matched, so this $in keeps every document while giving the
+            # (userN_id, matched, last_matched) indexes an equality on matched
+            # (explode-for-sort instead of a blocking in-memory SORT)
             last_match = await self.matches.find_one(
-                {"$or": [{"user1_id": user_id}, {"user2_id": user_id}]},
+                {
+                    "$or": [{"user1_id": user_id}, {"user2_id": user_id}],
+                    "matched": {"$in": [True, False]}
+                },
                 sort=[("last_matched", -1)]
             )
             
@@ -249,7 +346,7 @@ class MongoDBClient:
     async def get_bot_position(self) -> Optional[Dict]:
         """Get bot position from MongoDB"""
         try:
-            data = await self.bot_data.find_one({"data_type": "bot_position"})
+            data = await self.bot_data.find_one({"data_type": "bot_position"}, {"position": 1, "_id": 0})
             return data.get("position") if data else None
         except Exception as e:
             logger.error(f"Error retrieving bot position: {str(e)}")
@@ -258,31 +355,9 @@ class MongoDBClient:
     async def find_potential_matches(self, user_id: str, limit: int = 5) -> List[Dict]:
         """Find potential matches for a user based on compatibility"""
         try:
-            # Get user profile
-            user_profile = await self.profiles.find_one({"user_id": user_id})
-            if not user_profile:
-                return []
-                
-            # Find users with compatible profiles
-            matches = []
-            pipeline = [
-                # Exclude the user themselves
-                {"$match": {"user_id": {"$ne": user_id}}},
-                # Match compatibility criteria
-                {"$match": {
-                    # Match criteria would go here - simplified for now
-                    "looking_for": {"$in": [user_profile.get("gender", "any"), "any"]}
-                }},
-                # Sort by most compatible (this logic can be expanded)
-                {"$sort": {"last_active": -1}},
-                {"$limit": limit}
-            ]
-            
-            cursor = self.profiles.aggregate(pipeline)
-            async for doc in cursor:
-                matches.append(doc)
-                
-            return matches
+            pipeline = _potential_matches_pipeline(user_id, limit)
+            cursor = await self.profiles.aggregate(pipeline, batchSize=limit)
+            return await cursor.to_list(length=limit)
         except Exception as e:
             logger.error(f"Error finding matches for {user_id}: {str(e)}")
             return []
@@ -293,13 +368,12 @@ class MongoDBClient:
             # Handle different parameter types
             if isinstance(user_id, dict):
                 # The first parameter is actually the registration data
-                data = copy.deepcopy(user_id)
+                data = dict(user_id)
             else:
-                # Handle both new and old calling styles
-                data = registration_data if registration_data else {}
-                
-                # Make sure we're working with a copy to avoid modifying the original
-                data = copy.deepcopy(data)
+                # Handle both new and old calling styles.
+                # A shallow copy is enough - only top-level keys are written,
+                # the nested "data" dict is read but never modified
+                data = dict(registration_data) if registration_data else {}
                 
                 # Add user_id and type if passed as parameters
                 if user_id:
@@ -333,62 +407,25 @@ class MongoDBClient:
             if "completed" not in data:
                 data["completed"] = True
                 
-            # Make sure all important fields are at the root level if they're nested in data
-            important_fields = ["user_id", "username", "name", "age", "gender", "country", "continent", "occupation"]
-            for field in important_fields:
-                if field not in data and "data" in data and field in data["data"]:
-                    data[field] = data["data"][field]
+            # Flatten in one pass: nested fields first, root fields override them.
+            # The nested mirror and session-only keys are left out of the stored document.
+            nested = data.get("data") if isinstance(data.get("data"), dict) else {}
+            flat_data = {
+                key: value
+                for key, value in {**nested, **data}.items()
+                if key not in UNSAVED_REGISTRATION_FIELDS
+            }
             
             # Ensure user_id is available in data
-            if "user_id" not in data:
+            if "user_id" not in flat_data:
                 logger.error("Cannot save registration without user_id")
                 return False
-                
-            # Create a flattened version of the data to save
-            flat_data = {}
             
-            # Check for username in all possible locations with detailed logging
-            username = data.get("username", None)
-            logger.info(f"Initial username check at root level: {username}")
-            
-            if not username and "data" in data:
-                username = data["data"].get("username", None)
-                logger.info(f"Secondary username check in data object: {username}")
-            
-            # Try one more place - directly in the session object
-            if not username:
-                username = data.get("username", None)  # Try root again just in case
-                logger.info(f"Final username check attempt: {username}")
-                
-            # Log username search results
-            if username:
-                logger.info(f"✅ Successfully found username '{username}' in registration data")
-            else:
-                logger.warning(f"❌ Username not found in any location in registration data")
-                logger.warning(f"Full data object for debugging: {data}")
-                
-            # Start with all fields at the root level
-            for key, value in data.items():
-                if key != "data":  # Skip the nested data object for now
-                    flat_data[key] = value
-            
-            # If there's a nested data object, extract its fields
-            if "data" in data and isinstance(data["data"], dict):
-                for key, value in data["data"].items():
-                    # For username, always use the one we found earlier
-                    if key == "username" and username:
-                        flat_data["username"] = username
-                    # Don't overwrite root fields with nested ones for other fields
-                    elif key not in flat_data:
-                        flat_data[key] = value
-                        
-            # Finally, ensure username is set if we found it
+            # Root username wins, falling back to the nested one
+            username = flat_data.get("username") or nested.get("username")
             if username:
                 flat_data["username"] = username
             
-            # Log the flattened data for debugging
-            logger.info(f"Flattened registration data: {flat_data}")
-            
             # Save to registrations collection
             result = await self.registrations.update_one(
                 {"user_id": flat_data["user_id"]},
@@ -398,45 +435,40 @@ class MongoDBClient:
             
             # Verify the document was actually inserted/updated
             if result.matched_count == 0 and result.upserted_id is None:
-                logger.error(f"Failed to save registration for {flat_data.get('username', 'unknown')}: No document matched or inserted")
+                logger.error("Failed to save registration for %s: No document matched or inserted", username)
                 return False
             
-            # Log with the correct user information from the flattened data
-            username = flat_data.get('username', 'unknown')
-            reg_type = flat_data.get('type', 'unknown')
-            user_id = flat_data.get('user_id', 'unknown')
-            logger.info(f"Successfully saved registration for {username} (ID: {user_id}), type: {reg_type}")
-            
-            # Log essential registration data fields for debugging
-            logger.info(f"Registration saved with fields: user_id={user_id}, username={username}, type={reg_type}, completed={flat_data.get('completed', False)}")
             return True
         except Exception as e:
-            logger.error(f"Error saving registration for {data.get('user_id', 'unknown')}: {str(e)}")
-            # Log more detailed debug information
-            logger.error(f"Registration data that failed: {data}")
+            logger.error("Error saving registration for %s: %s", data.get('user_id', 'unknown'), e)
             return False
     
+    def _registration_filter(self, filter_type: Optional[str], filter_location: Optional[str]):
+        """Build the registrations query and the collation it must run with"""
+        query = {"completed": True}
+        if filter_type:
+            query["registration_type"] = filter_type
+        if not filter_location:
+            # Simple collation, so the registration_type index stays usable
+            return query, None
+        # Case-insensitive equality can seek the collated location indexes,
+        # where an unanchored $regex had to scan every completed registration
+        query["$or"] = [
+            {"country": filter_location},
+            {"continent": filter_location}
+        ]
+        return query, CASE_INSENSITIVE
+    
     async def get_registrations(self, filter_type: Optional[str] = None, 
                              filter_location: Optional[str] = None) -> List[Dict]:
         """Get registrations with optional filters"""
         try:
-            # Build query
-            query = {"completed": True}
-            if filter_type:
-                query["registration_type"] = filter_type
-            if filter_location:
-                query["$or"] = [
-                    {"country": {"$regex": filter_location, "$options": "i"}},
-                    {"continent": {"$regex": filter_location, "$options": "i"}}
-                ]
+            query, collation = self._registration_filter(filter_type, filter_location)
             
             # Get registrations
-            registrations = []
-            cursor = self.registrations.find(query).sort("registration_time", -1)
-            async for doc in cursor:
-                registrations.append(doc)
-            
-            return registrations
+            # Large batches keep getMore round trips low on big exports
+            cursor = self.registrations.find(query, collation=collation).sort("registration_time", -1).batch_size(1000)
+            return await cursor.to_list(length=None)
         except Exception as e:
             logger.error(f"Error getting registrations: {str(e)}")
             return []
@@ -445,24 +477,55 @@ class MongoDBClient:
                                filter_location: Optional[str] = None) -> int:
         """Count registrations with optional filters"""
         try:
-            # Build query
-            query = {"completed": True}
-            if filter_type:
-                query["registration_type"] = filter_type
-            if filter_location:
-                query["$or"] = [
-                    {"country": {"$regex": filter_location, "$options": "i"}},
-                    {"continent": {"$regex": filter_location, "$options": "i"}}
-                ]
+            query, collation = self._registration_filter(filter_type, filter_location)
             
             # Count registrations
-            return await self.registrations.count_documents(query)
+            return await self.registrations.count_documents(query, collation=collation)
         except Exception as e:
             logger.error(f"Error counting registrations: {str(e)}")
             return 0
             
-    async def save_hosts(self, host_ids: List[str]) -> bool:
-        """Save list of hosts to database"""
+    async def get_bot_singletons(self, data_types: tuple = ("hosts", "vips", "event", "subscribers")) -> Dict[str, Dict]:
+        """Get several bot_data documents in one query, keyed by data_type"""
+        try:
+            cursor = self.bot_data.find({"data_type": {"$in": list(data_types)}}, {"_id": 0})
+            docs = await cursor.to_list(length=len(data_types))
+            return {doc["data_type"]: doc for doc in docs}
+        except Exception as e:
+            logger.error(f"Error retrieving bot data: {str(e)}")
+            return {}
+    
+    async def _update_id_set(self, data_type: str, add: Optional[List[str]], remove: Optional[List[str]]):
+        """Apply an add/remove diff to a bot_data user_ids array server-side"""
+        now = datetime.now()
+        # $addToSet and $pullAll can't touch the same field in one update,
+        # so send them as one ordered batch (add first, then remove)
+        operations = []
+        if add:
+            operations.append(UpdateOne(
+                {"data_type": data_type},
+                {"$addToSet": {"user_ids": {"$each": list(add)}}, "$set": {"updated_at": now}},
+                upsert=True
+            ))
+        if remove:
+            operations.append(UpdateOne(
+                {"data_type": data_type},
+                {"$pullAll": {"user_ids": list(remove)}, "$set": {"updated_at": now}}
+            ))
+        if operations:
+            await self.bot_data.bulk_write(operations)
+    
+    async def save_hosts(self, add: Optional[List[str]] = None, remove: Optional[List[str]] = None) -> bool:
+        """Add and/or remove hosts without rewriting the whole list"""
+        try:
+            await self._update_id_set("hosts", add, remove)
+            return True
+        except Exception as e:
+            logger.error(f"Error saving hosts: {str(e)}")
+            return False
+    
+    async def save_hosts_full(self, host_ids: List[str]) -> bool:
+        """Replace the whole list of hosts (initial load / migrations)"""
         try:
             await self.bot_data.update_one(
                 {"data_type": "hosts"},
@@ -477,7 +540,7 @@ class MongoDBClient:
     async def get_hosts(self) -> List[str]:
         """Get list of hosts from database"""
         try:
-            result = await self.bot_data.find_one({"data_type": "hosts"})
+            result = await self.bot_data.find_one({"data_type": "hosts"}, {"user_ids": 1, "_id": 0})
             if result and "user_ids" in result:
                 return result["user_ids"]
             return []
@@ -501,7 +564,7 @@ class MongoDBClient:
     async def get_event_date(self) -> str:
         """Get event date from database"""
         try:
-            result = await self.bot_data.find_one({"data_type": "event"})
+            result = await self.bot_data.find_one({"data_type": "event"}, {"date": 1, "_id": 0})
             if result and "date" in result:
                 return result["date"]
             return ""
@@ -509,8 +572,17 @@ class MongoDBClient:
             logger.error(f"Error retrieving event date: {str(e)}")
             return ""
     
-    async def save_subscribers(self, subscriber_ids: List[str]) -> bool:
-        """Save list of subscribers to database"""
+    async def save_subscribers(self, add: Optional[List[str]] = None, remove: Optional[List[str]] = None) -> bool:
+        """Add and/or remove subscribers without rewriting the whole list"""
+        try:
+            await self._update_id_set("subscribers", add, remove)
+            return True
+        except Exception as e:
+            logger.error(f"Error saving subscribers: {str(e)}")
+            return False
+    
+    async def save_subscribers_full(self, subscriber_ids: List[str]) -> bool:
+        """Replace the whole list of subscribers (initial load / migrations)"""
         try:
             await self.bot_data.update_one(
                 {"data_type": "subscribers"},
@@ -521,11 +593,11 @@ class MongoDBClient:
         except Exception as e:
             logger.error(f"Error saving subscribers: {str(e)}")
             return False
-            
+    
     async def get_subscribers(self) -> List[str]:
         """Get list of subscribers from database"""
         try:
-            result = await self.bot_data.find_one({"data_type": "subscribers"})
+            result = await self.bot_data.find_one({"data_type": "subscribers"}, {"user_ids": 1, "_id": 0})
             if result and "user_ids" in result:
                 return result["user_ids"]
             return []
@@ -535,42 +607,35 @@ class MongoDBClient:
             
     async def save_subscriber(self, user_id: str, username: str) -> bool:
         """Save a single subscriber"""
+        now = datetime.now()
         try:
-            # Get current subscribers
-            subscribers_doc = await self.bot_data.find_one({"data_type": "subscribers"})
-            subscriber_ids = subscribers_doc.get("user_ids", []) if subscribers_doc else []
-            
-            # Add new subscriber if not already present
-            if user_id not in subscriber_ids:
-                subscriber_ids.append(user_id)
-                
-            # Update subscribers document
-            await self.bot_data.update_one(
+            # Add to the subscriber list server-side ($addToSet skips duplicates atomically)
+            add_subscriber = self.bot_data.update_one(
                 {"data_type": "subscribers"},
                 {
-                    "$set": {
-                        "user_ids": subscriber_ids,
-                        "updated_at": datetime.now()
-                    }
+                    "$addToSet": {"user_ids": user_id},
+                    "$set": {"updated_at": now}
                 },
                 upsert=True
             )
             
             # Also save in subscribers collection for additional metadata
-            await self.subscribers.update_one(
+            save_metadata = self.subscribers.update_one(
                 {"user_id": user_id},
                 {
                     "$set": {
                         "username": username,
-                        "updated_at": datetime.now()
+                        "updated_at": now
                     },
                     "$setOnInsert": {
-                        "subscribed_at": datetime.now()
+                        "subscribed_at": now
                     }
                 },
                 upsert=True
             )
             
+            await asyncio.gather(add_subscriber, save_metadata)
+            
             return True
         except Exception as e:
             logger.error(f"Error saving subscriber {user_id}: {str(e)}")
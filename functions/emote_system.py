@@ -4,13 +4,14 @@ Supports single emotes, targeted emotes, couple emotes, and group emotes
 """
 
 from highrise import BaseBot, User
-from highrise.models import *
-from highrise.webapi import *
 import re
+import itertools
 import asyncio
+import time
+from random import sample
 
 # Available emotes list
-AVAILABLE_EMOTES = [
+AVAILABLE_EMOTES = (
     "emote-kiss", "emote-no", "emote-sad", "emote-yes", "emote-laughing",
     "emote-hello", "emote-wave", "emote-shy", "emote-tired", "emoji-angry",
     "idle-loop-sitfloor", "emoji-thumbsup", "emote-lust", "emoji-cursing",
@@ -28,7 +29,77 @@ AVAILABLE_EMOTES = [
     "emote-punkguitar", "emote-zombierun", "emote-fashionista",
     "emote-gravity", "dance-icecream", "dance-wrong", "idle-uwu",
     "idle-dance-tiktok4", "emote-hug"
-]
+)
+
+def _build_emote_index(emote_ids):
+    """Map every name an emote answers to (each "-"/"_" suffix, plus the full ID) to its ID"""
+    index = {}
+    for emote_id in emote_ids:
+        # "idle-loop-sitfloor" answers to "loop-sitfloor" and "sitfloor"
+        for i, char in enumerate(emote_id):
+            if char in "-_":
+                index.setdefault(emote_id[i + 1:], emote_id)  # First listed emote wins
+        index.setdefault(emote_id, emote_id)
+    return index
+
+# Emote name -> emote ID, built once (AVAILABLE_EMOTES never changes at runtime)
+EMOTE_INDEX = _build_emote_index(AVAILABLE_EMOTES)
+
+def _short_name(emote_id: str) -> str:
+    """The name people type for an emote: the part after the last "-" (or "_")"""
+    return emote_id.rpartition('-')[2] if '-' in emote_id else emote_id.rpartition('_')[2]
+
+def _build_name_trie(names):
+    """Build a character trie over emote names; the "" key marks a complete name"""
+    trie = {}
+    # Sorted insertion keeps every node's children in alphabetical order
+    for name in sorted(names):
+        node = trie
+        for char in name:
+            node = node.setdefault(char, {})
+        node[""] = name
+    return trie
+
+def _iter_trie_names(node):
+    """Yield the names below a trie node in alphabetical order"""
+    for char, child in node.items():
+        if char:
+            yield from _iter_trie_names(child)
+        else:
+            yield child
+
+# Prefix index over the names people type ("kiss", "sitfloor", "singing") for autocomplete
+EMOTE_NAME_TRIE = _build_name_trie(set(map(_short_name, AVAILABLE_EMOTES)))
+
+def complete_emote_name(prefix: str, limit: int = 10) -> list[str]:
+    """Return up to limit emote names starting with prefix, alphabetically"""
+    node = EMOTE_NAME_TRIE
+    for char in prefix.lower().strip():
+        node = node.get(char)
+        if node is None:
+            return []
+    return list(itertools.islice(_iter_trie_names(node), limit))
+
+# Short names suggested by !emo
+EMOTE_SHORT_NAMES = tuple(map(_short_name, AVAILABLE_EMOTES))
+EMO_SUGGESTION_COUNT = min(5, len(EMOTE_SHORT_NAMES))
+
+# Longest message Highrise accepts in room chat
+CHAT_MESSAGE_LIMIT = 255
+
+def _pack_chat_lines(lines) -> tuple[str, ...]:
+    """Join lines with newlines into as few messages as fit within CHAT_MESSAGE_LIMIT"""
+    messages = []
+    message = ""
+    for line in lines:
+        if message and len(message) + 1 + len(line) > CHAT_MESSAGE_LIMIT:
+            messages.append(message)
+            message = line
+        else:
+            message = f"{message}\n{line}" if message else line
+    if message:
+        messages.append(message)
+    return tuple(messages)
 
 # Emote categories for better organization
 EMOTE_CATEGORIES = {
@@ -40,8 +111,46 @@ EMOTE_CATEGORIES = {
     "emojis": ["thumbsup", "cursing", "greedy", "flex", "gagging", "celebrate"]
 }
 
+# !emotes display line per category, built once (first 8 names keep messages short)
+CATEGORY_LINES = tuple(
+    f"**{category.title()}:** {', '.join(emote_list[:8])}"
+    + (f"... ({len(emote_list)} total)" if len(emote_list) > 8 else "")
+    for category, emote_list in EMOTE_CATEGORIES.items()
+)
+
+def _build_category_listing(category, emote_list, chunk_size=15):
+    """Build the !allemo lines for one category, names split into chunks of chunk_size"""
+    chunks = [", ".join(emote_list[i:i + chunk_size]) for i in range(0, len(emote_list), chunk_size)]
+    if len(chunks) > 1:
+        chunks = [f"**Part {i}:** {emote_text}" for i, emote_text in enumerate(chunks, 1)]
+    return (
+        f"🎭 **{category.title()} Emotes** 🎭",
+        *chunks,
+        "💡 Type emote name to use, or !emote @user emotename"
+    )
+
+CATEGORY_NAMES = ", ".join(EMOTE_CATEGORIES)  # for !allemo help and errors
+
+# Ready-to-send chat messages for the listing commands, packed once
+EMOTES_MESSAGES = _pack_chat_lines((
+    "🎭 **Available Emotes - ALL LOOP FOREVER!** 🔄",
+    "💡 Type emote name = infinite loop | 'emotename all' = everyone loops!",
+    *CATEGORY_LINES,
+    "� All emotes loop until you say 'stop' or use another emote!",
+    "💡 Commands: !numbers (1-50), !allemo category, !loop emote @user"
+))
+CATEGORY_HELP_MESSAGES = _pack_chat_lines((
+    "🎭 **Emote Categories Available** 🎭",
+    f"📋 Categories: {CATEGORY_NAMES}",
+    "💡 Usage: !allemo emotions (or actions/dances/poses/idle/emojis)"
+))
+CATEGORY_MESSAGES = {
+    category: _pack_chat_lines(_build_category_listing(category, emote_list))
+    for category, emote_list in EMOTE_CATEGORIES.items()
+}
+
 # Numbered emotes for quick access (1-50)
-NUMBERED_EMOTES = [
+NUMBERED_EMOTES = (
     "emote-swordfight", "emote-kiss", "emote-wave", "emote-hello", "dance-macarena",
     "emote-lust", "emote-shy", "emote-bow", "dance-tiktok8", "emote-cute",
     "emote-sad", "emote-yes", "emote-no", "emote-laughing", "dance-blackpink",
@@ -52,116 +161,133 @@ NUMBERED_EMOTES = [
     "emote-pose1", "emote-pose3", "emote-pose5", "emote-pose7", "emote-pose8",
     "idle-enthusiastic", "idle_singing", "idle-dance-casual", "idle-uwu", "emoji-thumbsup",
     "emoji-flex", "emoji-celebrate", "emote-hot", "emote-snowball", "emote-charging"
-]
+)
+
+# Display name for each numbered emote, in the same order
+NUMBERED_EMOTE_NAMES = tuple(map(_short_name, NUMBERED_EMOTES))
 
-# Global loop tasks storage
-ACTIVE_LOOPS = {}
+# !numbers listing, ten "n.name" entries per line for readability
+NUMBERED_EMOTE_LINES = tuple(
+    " | ".join(f"{i + j}.{name}" for j, name in enumerate(NUMBERED_EMOTE_NAMES[i:i + 10], 1))
+    for i in range(0, min(len(NUMBERED_EMOTE_NAMES), 50), 10)
+)
+NUMBERS_MESSAGES = _pack_chat_lines((
+    "🔢 **Numbered Emotes (Type 1-50)** 🔢",
+    *NUMBERED_EMOTE_LINES,
+    "💡 Just type the number (e.g., '5') to use that emote!"
+))
+
+# "!command target [emote]" -> (target, emote or None), compiled once for all commands
+COMMAND_ARGS_RE = re.compile(r'\s*\S+\s+(\S+)(?:\s+(\S+))?')
+
+# Global emote loop registry, replayed by one shared heartbeat task
+USER_LOOPS = {}  # looping user ID -> {'emote_id', 'user_ids', 'starter', 'type', 'emote_name'}
+LOOPS_BY_STARTER = {}  # starter user ID -> IDs of the users whose loops they started
+_heartbeat_task = None  # runs while any loop is registered
+_heartbeat_bot = None  # bot the heartbeat sends through (latest session)
 
 # Default loop interval for all emotes
 DEFAULT_EMOTE_INTERVAL = 4  # seconds between emote repeats
 
-async def find_user_by_username(bot: BaseBot, username: str) -> str | None:
-    """Find a user ID by username in the room"""
+# Room user snapshot shared by emote commands (saves a get_room_users() RPC per command)
+ROOM_USERS_TTL = 2.0  # seconds a snapshot is reused
+_room_users_cache = None  # (User, Position) pairs from the last get_room_users()
+_room_users_time = float('-inf')  # time.monotonic() of that fetch
+_users_by_name = {}  # lowercase username -> User for the cached snapshot
+
+async def get_room_users_cached(bot: BaseBot) -> list:
+    """Get the room's (user, position) pairs, reusing a snapshot younger than ROOM_USERS_TTL"""
+    global _room_users_cache, _room_users_time, _users_by_name
+    if _room_users_cache is not None and time.monotonic() - _room_users_time < ROOM_USERS_TTL:
+        return _room_users_cache
+    
+    room_users = await bot.highrise.get_room_users()
+    content = getattr(room_users, "content", None)
+    if content is None:
+        # The SDK returns an Error model instead of raising - don't cache a failed fetch
+        return []
+    _users_by_name = {room_user.username.lower(): room_user for room_user, _ in content}
+    _room_users_cache = content
+    _room_users_time = time.monotonic()
+    return content
+
+def invalidate_room_users():
+    """Drop the cached room snapshot (call on user join/leave)"""
+    global _room_users_cache
+    _room_users_cache = None
+
+def is_privileged(bot: BaseBot, user: User) -> bool:
+    """Whether user is the room owner, a host or a VIP (hosts/vips are sets on the bot)"""
+    return (
+        user.id == getattr(bot, 'owner_id', None) or
+        user.id in getattr(bot, 'hosts', ()) or
+        user.id in getattr(bot, 'vips', ())
+    )
+
+async def find_room_user(bot: BaseBot, username: str) -> User | None:
+    """Find a user in the room by case-insensitive username"""
+    # Remove @ if present
+    clean_username = username.replace("@", "").strip()
+    
+    # Refresh the room snapshot if stale, then look the name up directly.
+    # Any fetch failure reads as "not found" - callers only check for None
     try:
-        # Remove @ if present
-        clean_username = username.replace("@", "").strip()
-        
-        # Get room users
-        room_users = await bot.highrise.get_room_users()
-        
-        for room_user, _ in room_users.content:
-            if room_user.username.lower() == clean_username.lower():
-                return room_user.id
-        return None
+        if not await get_room_users_cached(bot):
+            return None
     except Exception as e:
         print(f"Error finding user {username}: {e}")
         return None
+    return _users_by_name.get(clean_username.lower())
 
-async def get_emote_id_from_name(emote_name: str) -> str | None:
+async def find_user_by_username(bot: BaseBot, username: str) -> str | None:
+    """Find a user ID by username in the room"""
+    room_user = await find_room_user(bot, username)
+    return room_user.id if room_user else None
+
+async def chat_messages(bot: BaseBot, messages) -> None:
+    """Send prepacked messages to room chat"""
+    # One at a time so they keep their order in chat
+    for message in messages:
+        await bot.highrise.chat(message)
+
+def get_emote_id_from_name(emote_name: str) -> str | None:
     """Convert emote name to full emote ID"""
-    emote_name = emote_name.lower().strip()
-    
-    for emote_id in AVAILABLE_EMOTES:
-        # Check if the emote name matches the end of the emote ID
-        if emote_id.endswith(f"-{emote_name}") or emote_id.endswith(f"_{emote_name}"):
-            return emote_id
-        # Also check if it's an exact match for emoji types
-        if emote_id == f"emoji-{emote_name}" or emote_id == f"emote-{emote_name}":
-            return emote_id
-        # Check dance types
-        if emote_id == f"dance-{emote_name}":
-            return emote_id
-        # Check idle types
-        if emote_id == f"idle-{emote_name}" or emote_id == f"idle_{emote_name}":
-            return emote_id
-    return None
+    return EMOTE_INDEX.get(emote_name.lower().strip())
 
 async def single_emote(bot: BaseBot, user: User, message: str) -> bool:
     """Handle single emote commands (user types 'kiss' and does emote-kiss) - Now with auto-loop!"""
     try:
         message_lower = message.lower().strip()
         
+        # Most chat isn't an emote - bail out after one hash lookup
+        emote_name = message_lower.removesuffix(" all").rstrip()  # already stripped on the left
+        emote_id = EMOTE_INDEX.get(emote_name)
+        if not emote_id:
+            return False
+        
+        # Stop any existing loop for this user
+        stop_user_loop(bot, user.id, user.username)
+        
         # Check for "emote_name all" pattern for group emotes
-        if " all" in message_lower:
-            emote_name = message_lower.replace(" all", "").strip()
-            emote_id = await get_emote_id_from_name(emote_name)
+        if emote_name != message_lower:
+            # Get all room users and start group loop
+            room_users = await get_room_users_cached(bot)
+            user_ids = [room_user.id for room_user, _ in room_users]
             
-            if emote_id:
-                # Stop any existing loop for this user
-                await stop_user_loop(bot, user.id, user.username)
-                
-                # Get all room users and start group loop
-                room_users = await bot.highrise.get_room_users()
-                user_ids = [room_user.id for room_user, _ in room_users.content]
+            if user_ids:
+                await bot.highrise.chat(f"🎭 {user.username} started {emote_name} loop for everyone! Say 'stop' to end it.")
                 
-                if user_ids:
-                    await bot.highrise.chat(f"🎭 {user.username} started {emote_name} loop for everyone! Say 'stop' to end it.")
-                    
-                    # Start group loop
-                    loop_key = f"group_{user.id}"
-                    loop_task = asyncio.create_task(
-                        group_emote_loop_task(bot, emote_id, user_ids, emote_name, user.username)
-                    )
-                    ACTIVE_LOOPS[loop_key] = {
-                        'task': loop_task,
-                        'starter': user.id,
-                        'type': 'group',
-                        'emote_name': emote_name
-                    }
-                    
-                    # Clean up when done
-                    loop_task.add_done_callback(lambda t: cleanup_loop(loop_key))
-                
-                return True
+                # Start group loop
+                await start_loop(bot, user.id, emote_id, user_ids, user.id, 'group', emote_name)
+            
+            return True
         
-        # Check for single emote
-        else:
-            emote_id = await get_emote_id_from_name(message_lower)
-            if emote_id:
-                # Stop any existing loop for this user
-                await stop_user_loop(bot, user.id, user.username)
-                
-                # Start new infinite loop for this emote
-                emote_name = message_lower
-                await bot.highrise.chat(f"🔄 {user.username} started {emote_name} loop! Use another emote or say 'stop' to change.")
-                
-                loop_key = f"single_{user.id}"
-                loop_task = asyncio.create_task(
-                    infinite_emote_loop_task(bot, emote_id, user.id, emote_name, user.username)
-                )
-                ACTIVE_LOOPS[loop_key] = {
-                    'task': loop_task,
-                    'starter': user.id,
-                    'type': 'single',
-                    'emote_name': emote_name
-                }
-                
-                # Clean up when done
-                loop_task.add_done_callback(lambda t: cleanup_loop(loop_key))
-                
-                return True
+        # Single emote - start new infinite loop for this emote
+        await bot.highrise.chat(f"🔄 {user.username} started {emote_name} loop! Use another emote or say 'stop' to change.")
         
-        return False
+        await start_loop(bot, user.id, emote_id, (user.id,), user.id, 'single', emote_name)
+        
+        return True
     except Exception as e:
         print(f"Error in single_emote: {e}")
         return False
@@ -171,15 +297,14 @@ async def emote(bot: BaseBot, user: User, message: str) -> None:
     Main emote command: !emote @username emotename
     Usage: !emote @john kiss
     """
+    args = COMMAND_ARGS_RE.match(message)
     try:
-        parts = message.split()
-        
-        if len(parts) < 3:
+        if not args or not args.group(2):
             await bot.highrise.chat("💡 Usage: !emote @username emotename\nExample: !emote @john kiss")
             return
         
-        target_username = parts[1]
-        emote_name = parts[2].lower()
+        target_username = args.group(1)
+        emote_name = args.group(2).lower()
         
         # Find target user
         target_user_id = await find_user_by_username(bot, target_username)
@@ -188,9 +313,13 @@ async def emote(bot: BaseBot, user: User, message: str) -> None:
             return
         
         # Get emote ID
-        emote_id = await get_emote_id_from_name(emote_name)
+        emote_id = get_emote_id_from_name(emote_name)
         if not emote_id:
-            await bot.highrise.chat(f"❌ Emote '{emote_name}' not found. Use !emotes to see available emotes.")
+            suggestions = complete_emote_name(emote_name, 5)
+            if suggestions:
+                await bot.highrise.chat(f"❌ Emote '{emote_name}' not found. Did you mean: {', '.join(suggestions)}?")
+            else:
+                await bot.highrise.chat(f"❌ Emote '{emote_name}' not found. Use !emotes to see available emotes.")
             return
         
         # Send emote to target user
@@ -203,124 +332,84 @@ async def emote(bot: BaseBot, user: User, message: str) -> None:
     except Exception as e:
         await bot.highrise.chat(f"❌ Error with emote command: {e}")
 
-async def fight(bot: BaseBot, user: User, message: str) -> None:
+async def pair_emote(bot: BaseBot, user: User, message: str, command: str, emote_id: str, announcement: str) -> None:
     """
-    Fight command: !fight @username
-    Both users will do sword fight emote
+    Shared body of the two-person commands (!fight, !hug, !flirt):
+    both users do emote_id, then announcement is chatted with {user} and {target} filled in
     """
+    args = COMMAND_ARGS_RE.match(message)
     try:
-        parts = message.split()
-        
-        if len(parts) < 2:
-            await bot.highrise.chat("💡 Usage: !fight @username")
+        if not args:
+            await bot.highrise.chat(f"💡 Usage: !{command} @username")
             return
         
-        target_username = parts[1]
+        target_username = args.group(1)
         target_user_id = await find_user_by_username(bot, target_username)
         
         if not target_user_id:
             await bot.highrise.chat(f"❌ User {target_username} not found in room")
             return
         
-        # Send fight emote to both users
-        await bot.highrise.send_emote("emote-swordfight", user.id)
-        await bot.highrise.send_emote("emote-swordfight", target_user_id)
+        # Send the emote to both users at once
+        await asyncio.gather(
+            bot.highrise.send_emote(emote_id, user.id),
+            bot.highrise.send_emote(emote_id, target_user_id)
+        )
         
         clean_username = target_username.replace("@", "")
-        await bot.highrise.chat(f"⚔️ {user.username} and {clean_username} are fighting! Let's see who wins! 🥷")
+        await bot.highrise.chat(announcement.format(user=user.username, target=clean_username))
         
     except Exception as e:
-        await bot.highrise.chat(f"❌ Error with fight command: {e}")
+        await bot.highrise.chat(f"❌ Error with {command} command: {e}")
+
+async def fight(bot: BaseBot, user: User, message: str) -> None:
+    """
+    Fight command: !fight @username
+    Both users will do sword fight emote
+    """
+    await pair_emote(bot, user, message, "fight", "emote-swordfight",
+                     "⚔️ {user} and {target} are fighting! Let's see who wins! 🥷")
 
 async def hug(bot: BaseBot, user: User, message: str) -> None:
     """
     Hug command: !hug @username
     Both users will do hug emote
     """
-    try:
-        parts = message.split()
-        
-        if len(parts) < 2:
-            await bot.highrise.chat("💡 Usage: !hug @username")
-            return
-        
-        target_username = parts[1]
-        target_user_id = await find_user_by_username(bot, target_username)
-        
-        if not target_user_id:
-            await bot.highrise.chat(f"❌ User {target_username} not found in room")
-            return
-        
-        # Send hug emote to both users
-        await bot.highrise.send_emote("emote-hug", user.id)
-        await bot.highrise.send_emote("emote-hug", target_user_id)
-        
-        clean_username = target_username.replace("@", "")
-        await bot.highrise.chat(f"🫂 {user.username} and {clean_username} are hugging! So sweet! ❤️")
-        
-    except Exception as e:
-        await bot.highrise.chat(f"❌ Error with hug command: {e}")
+    await pair_emote(bot, user, message, "hug", "emote-hug",
+                     "🫂 {user} and {target} are hugging! So sweet! ❤️")
 
 async def flirt(bot: BaseBot, user: User, message: str) -> None:
     """
     Flirt command: !flirt @username
     Both users will do lust emote
     """
-    try:
-        parts = message.split()
-        
-        if len(parts) < 2:
-            await bot.highrise.chat("💡 Usage: !flirt @username")
-            return
-        
-        target_username = parts[1]
-        target_user_id = await find_user_by_username(bot, target_username)
-        
-        if not target_user_id:
-            await bot.highrise.chat(f"❌ User {target_username} not found in room")
-            return
-        
-        # Send flirt emote to both users
-        await bot.highrise.send_emote("emote-lust", user.id)
-        await bot.highrise.send_emote("emote-lust", target_user_id)
-        
-        clean_username = target_username.replace("@", "")
-        await bot.highrise.chat(f"😏 {user.username} and {clean_username} are flirting! How romantic! 💕")
-        
-    except Exception as e:
-        await bot.highrise.chat(f"❌ Error with flirt command: {e}")
+    await pair_emote(bot, user, message, "flirt", "emote-lust",
+                     "😏 {user} and {target} are flirting! How romantic! 💕")
 
 async def emotes(bot: BaseBot, user: User, message: str) -> None:
     """
     Show available emotes organized by category
     """
     try:
-        await bot.highrise.chat("🎭 **Available Emotes - ALL LOOP FOREVER!** 🔄")
-        await bot.highrise.chat("💡 Type emote name = infinite loop | 'emotename all' = everyone loops!")
-        
-        # Show each category
-        for category, emote_list in EMOTE_CATEGORIES.items():
-            emote_names = ", ".join(emote_list[:8])  # Show first 8 to avoid message length limits
-            if len(emote_list) > 8:
-                emote_names += f"... ({len(emote_list)} total)"
-            await bot.highrise.chat(f"**{category.title()}:** {emote_names}")
-        
-        await bot.highrise.chat("� All emotes loop until you say 'stop' or use another emote!")
-        await bot.highrise.chat("💡 Commands: !numbers (1-50), !allemo category, !loop emote @user")
+        await chat_messages(bot, EMOTES_MESSAGES)
         
     except Exception as e:
         await bot.highrise.chat(f"❌ Error showing emotes: {e}")
 
-async def allemo(bot: BaseBot, user: User, message: str) -> None:
-    """Alias for emotes command"""
-    await emotes(bot, user, message)
-
 async def emo(bot: BaseBot, user: User, message: str) -> None:
-    """Show a random emote suggestion"""
+    """Show a random emote suggestion, or complete a partial name - !emo [prefix]"""
     try:
-        import random
-        random_emotes = random.sample(AVAILABLE_EMOTES, min(5, len(AVAILABLE_EMOTES)))
-        emote_names = [emote.split('-')[-1] for emote in random_emotes]
+        parts = message.split(None, 2)
+        if len(parts) >= 2:
+            prefix = parts[1].lower()
+            matches = complete_emote_name(prefix)
+            if matches:
+                await bot.highrise.chat(f"🎭 Emotes starting with '{prefix}': {', '.join(matches)}")
+            else:
+                await bot.highrise.chat(f"❌ No emotes start with '{prefix}'. Use !emotes to see available emotes.")
+            return
+        
+        emote_names = sample(EMOTE_SHORT_NAMES, EMO_SUGGESTION_COUNT)
         
         await bot.highrise.chat(f"🎭 Try these emotes: {', '.join(emote_names)}")
         await bot.highrise.chat("💡 Type the emote name or use !emote @user emotename")
@@ -331,105 +420,85 @@ async def emo(bot: BaseBot, user: User, message: str) -> None:
 async def allemo(bot: BaseBot, user: User, message: str) -> None:
     """Show emotes by category - !allemo emotions/actions/dances/poses/idle/emojis"""
     try:
-        parts = message.split()
+        parts = message.split(None, 2)
         
         if len(parts) < 2:
             # Show available categories
-            categories = list(EMOTE_CATEGORIES.keys())
-            await bot.highrise.chat("🎭 **Emote Categories Available** 🎭")
-            await bot.highrise.chat(f"📋 Categories: {', '.join(categories)}")
-            await bot.highrise.chat("💡 Usage: !allemo emotions (or actions/dances/poses/idle/emojis)")
+            await chat_messages(bot, CATEGORY_HELP_MESSAGES)
             return
         
-        category = parts[1].lower().strip()
-        
-        if category in EMOTE_CATEGORIES:
-            emote_list = EMOTE_CATEGORIES[category]
-            
-            # Split into chunks to avoid message length limits
-            chunk_size = 15
-            chunks = [emote_list[i:i + chunk_size] for i in range(0, len(emote_list), chunk_size)]
-            
-            await bot.highrise.chat(f"🎭 **{category.title()} Emotes** 🎭")
-            
-            for i, chunk in enumerate(chunks, 1):
-                emote_text = ", ".join(chunk)
-                if len(chunks) > 1:
-                    await bot.highrise.chat(f"**Part {i}:** {emote_text}")
-                else:
-                    await bot.highrise.chat(f"{emote_text}")
-            
-            await bot.highrise.chat("💡 Type emote name to use, or !emote @user emotename")
+        messages = CATEGORY_MESSAGES.get(parts[1].lower().strip())
+        if messages:
+            await chat_messages(bot, messages)
         else:
-            categories = list(EMOTE_CATEGORIES.keys())
-            await bot.highrise.chat(f"❌ Invalid category. Use: {', '.join(categories)}")
+            await bot.highrise.chat(f"❌ Invalid category. Use: {CATEGORY_NAMES}")
         
     except Exception as e:
         await bot.highrise.chat(f"❌ Error showing category emotes: {e}")
 
-def cleanup_loop(loop_key: str):
-    """Clean up completed loop tasks"""
-    if loop_key in ACTIVE_LOOPS:
-        del ACTIVE_LOOPS[loop_key]
+async def start_loop(bot: BaseBot, user_id: str, emote_id: str, user_ids, starter_id: str, loop_type: str, emote_name: str) -> None:
+    """Register user_id's emote loop with the heartbeat and play the first emote now"""
+    global _heartbeat_task, _heartbeat_bot
+    user_ids = tuple(user_ids)  # the caller's list may change under us
+    USER_LOOPS[user_id] = {
+        'emote_id': emote_id,
+        'user_ids': user_ids,
+        'starter': starter_id,
+        'type': loop_type,
+        'emote_name': emote_name
+    }
+    LOOPS_BY_STARTER.setdefault(starter_id, set()).add(user_id)
+    
+    _heartbeat_bot = bot
+    if _heartbeat_task is None or _heartbeat_task.done():
+        _heartbeat_task = asyncio.create_task(emote_heartbeat())
+    
+    # Don't make the new loop wait for the next heartbeat tick
+    send_emote = bot.highrise.send_emote
+    await asyncio.gather(*(send_emote(emote_id, uid) for uid in user_ids), return_exceptions=True)
+
+def _unindex_loop(starter_id: str, user_id: str):
+    """Drop user_id's loop from the starter index"""
+    user_ids = LOOPS_BY_STARTER.get(starter_id)
+    if user_ids is not None:
+        user_ids.discard(user_id)
+        if not user_ids:
+            del LOOPS_BY_STARTER[starter_id]
 
-async def stop_user_loop(bot: BaseBot, user_id: str, username: str) -> bool:
+def stop_user_loop(bot: BaseBot, user_id: str, username: str) -> bool:
     """Stop any active loops for a user"""
     stopped = False
     
-    # Find and cancel all loops for this user
-    for key, loop_info in list(ACTIVE_LOOPS.items()):
-        if (key == f"single_{user_id}" or 
-            key == f"group_{user_id}" or 
-            loop_info.get('starter') == user_id):
-            
-            loop_info['task'].cancel()
-            emote_name = loop_info.get('emote_name', 'emote')
-            del ACTIVE_LOOPS[key]
-            stopped = True
+    # The user's own loop, plus loops they started on others
+    for looping_id in (user_id, *LOOPS_BY_STARTER.get(user_id, ())):
+        loop_info = USER_LOOPS.pop(looping_id, None)
+        if loop_info is None:
+            continue
+        _unindex_loop(loop_info['starter'], looping_id)
+        stopped = True
     
     return stopped
 
-async def infinite_emote_loop_task(bot: BaseBot, emote_id: str, user_id: str, emote_name: str, username: str):
-    """Background task for infinite emote looping until stopped"""
+async def emote_heartbeat():
+    """Background task replaying every registered loop's emote each interval"""
     try:
-        while True:
-            try:
-                await bot.highrise.send_emote(emote_id, user_id)
-                await asyncio.sleep(DEFAULT_EMOTE_INTERVAL)
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                print(f"Infinite loop emote error: {e}")
-                await asyncio.sleep(1)  # Short delay before retry
+        # Exits on its own once the last loop is stopped
+        while USER_LOOPS:
+            await asyncio.sleep(DEFAULT_EMOTE_INTERVAL)
+            
+            # Send every emote at once; users that can't receive
+            # emotes just return an exception instead. Resolved per tick, not
+            # before the loop: a reconnect swaps in a new _heartbeat_bot
+            send_emote = _heartbeat_bot.highrise.send_emote
+            await asyncio.gather(
+                *(send_emote(loop_info['emote_id'], uid)
+                  for loop_info in USER_LOOPS.values()
+                  for uid in loop_info['user_ids']),
+                return_exceptions=True
+            )
         
     except asyncio.CancelledError:
         pass  # Silent cancellation
-    except Exception as e:
-        await bot.highrise.chat(f"❌ {emote_name} loop error: {e}")
-
-async def group_emote_loop_task(bot: BaseBot, emote_id: str, user_ids: list, emote_name: str, starter_username: str):
-    """Background task for group emote looping"""
-    try:
-        while True:
-            try:
-                # Send emote to all users in the list
-                for user_id in user_ids:
-                    try:
-                        await bot.highrise.send_emote(emote_id, user_id)
-                    except:
-                        continue  # Skip users that can't receive emotes
-                
-                await asyncio.sleep(DEFAULT_EMOTE_INTERVAL)
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                print(f"Group loop emote error: {e}")
-                await asyncio.sleep(1)
-        
-    except asyncio.CancelledError:
-        pass  # Silent cancellation  
-    except Exception as e:
-        await bot.highrise.chat(f"❌ Group {emote_name} loop error: {e}")
 
 async def number_emote(bot: BaseBot, user: User, message: str) -> bool:
     """Handle number emotes (1-50) for quick emote access - Now with auto-loop!"""
@@ -444,26 +513,13 @@ async def number_emote(bot: BaseBot, user: User, message: str) -> bool:
                 emote_id = NUMBERED_EMOTES[number - 1]
                 
                 # Stop any existing loop for this user
-                await stop_user_loop(bot, user.id, user.username)
+                stop_user_loop(bot, user.id, user.username)
                 
-                # Get emote name for display
-                emote_name = emote_id.split('-')[-1] if '-' in emote_id else emote_id.split('_')[-1]
+                emote_name = NUMBERED_EMOTE_NAMES[number - 1]
                 await bot.highrise.chat(f"🔄 {user.username} started #{number} ({emote_name}) loop! Use another emote or say 'stop' to change.")
                 
                 # Start infinite loop
-                loop_key = f"single_{user.id}"
-                loop_task = asyncio.create_task(
-                    infinite_emote_loop_task(bot, emote_id, user.id, emote_name, user.username)
-                )
-                ACTIVE_LOOPS[loop_key] = {
-                    'task': loop_task,
-                    'starter': user.id,
-                    'type': 'single',
-                    'emote_name': emote_name
-                }
-                
-                # Clean up when done
-                loop_task.add_done_callback(lambda t: cleanup_loop(loop_key))
+                await start_loop(bot, user.id, emote_id, (user.id,), user.id, 'single', emote_name)
                 
                 return True
             else:
@@ -478,29 +534,15 @@ async def number_emote(bot: BaseBot, user: User, message: str) -> bool:
 async def numbers(bot: BaseBot, user: User, message: str) -> None:
     """Show numbered emotes list"""
     try:
-        await bot.highrise.chat("🔢 **Numbered Emotes (Type 1-50)** 🔢")
-        
-        # Show in groups of 10 for readability
-        for i in range(0, min(len(NUMBERED_EMOTES), 50), 10):
-            chunk = []
-            for j in range(10):
-                if i + j < len(NUMBERED_EMOTES):
-                    emote_id = NUMBERED_EMOTES[i + j]
-                    emote_name = emote_id.split('-')[-1] if '-' in emote_id else emote_id.split('_')[-1]
-                    chunk.append(f"{i + j + 1}.{emote_name}")
-            
-            await bot.highrise.chat(" | ".join(chunk))
-        
-        await bot.highrise.chat("💡 Just type the number (e.g., '5') to use that emote!")
+        await chat_messages(bot, NUMBERS_MESSAGES)
         
     except Exception as e:
         await bot.highrise.chat(f"❌ Error showing numbered emotes: {e}")
 
 async def loop(bot: BaseBot, user: User, message: str) -> None:
     """Loop emote command - !loop emotename [@target] (target requires privileges) - Now infinite by default!"""
+    parts = message.split(None, 2)
     try:
-        parts = message.split()
-        
         if len(parts) < 2:
             await bot.highrise.chat("💡 Usage: !loop emotename [@target]")
             await bot.highrise.chat("Example: !loop kiss (loops forever until stopped)")
@@ -510,18 +552,11 @@ async def loop(bot: BaseBot, user: User, message: str) -> None:
         target_user_id = user.id  # default to self
         target_username = user.username
         
-        # Parse target if provided
-        if len(parts) >= 3 and parts[-1].startswith("@"):
-            target_username_input = parts[-1]
-            
+        # Parse target if provided (the last word of the message)
+        target_username_input = parts[2].rsplit(None, 1)[-1] if len(parts) == 3 else ""
+        if target_username_input.startswith("@"):
             # Check if user has permission to target others
-            is_privileged = (
-                user.id == getattr(bot, 'owner_id', None) or 
-                user.id in getattr(bot, 'hosts', []) or 
-                user.id in getattr(bot, 'vips', [])
-            )
-            
-            if not is_privileged:
+            if not is_privileged(bot, user):
                 await bot.highrise.chat("❌ Only owners, hosts, and VIPs can loop emotes on other users!")
                 return
             
@@ -533,77 +568,34 @@ async def loop(bot: BaseBot, user: User, message: str) -> None:
             target_username = target_username_input.replace("@", "")
         
         # Get emote ID
-        emote_id = await get_emote_id_from_name(emote_name)
+        emote_id = get_emote_id_from_name(emote_name)
         if not emote_id:
             await bot.highrise.chat(f"❌ Emote '{emote_name}' not found. Use !emotes to see available emotes.")
             return
         
         # Stop any existing loop for the target user
-        await stop_user_loop(bot, target_user_id, target_username)
+        stop_user_loop(bot, target_user_id, target_username)
         
         # Start new infinite loop
         await bot.highrise.chat(f"🔄 {user.username} started infinite {emote_name} loop for {target_username}! Say 'stop' to end it.")
         
-        # Create loop task
-        loop_key = f"single_{target_user_id}"
-        loop_task = asyncio.create_task(
-            infinite_emote_loop_task(bot, emote_id, target_user_id, emote_name, target_username)
-        )
-        ACTIVE_LOOPS[loop_key] = {
-            'task': loop_task,
-            'starter': user.id,
-            'type': 'single',
-            'emote_name': emote_name
-        }
-        
-        # Clean up when done
-        loop_task.add_done_callback(lambda t: cleanup_loop(loop_key))
+        await start_loop(bot, target_user_id, emote_id, (target_user_id,), user.id, 'single', emote_name)
         
     except Exception as e:
         await bot.highrise.chat(f"❌ Error with loop command: {e}")
 
-async def emote_loop_task(bot: BaseBot, emote_id: str, user_id: str, duration: int, emote_name: str, username: str):
-    """Background task for looping emotes"""
-    try:
-        start_time = asyncio.get_event_loop().time()
-        end_time = start_time + duration
-        
-        while asyncio.get_event_loop().time() < end_time:
-            try:
-                await bot.highrise.send_emote(emote_id, user_id)
-                await asyncio.sleep(3)  # 3 second intervals
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                print(f"Loop emote error: {e}")
-                await asyncio.sleep(1)  # Short delay before retry
-        
-        await bot.highrise.chat(f"⏹️ {emote_name} loop finished for {username}")
-        
-    except asyncio.CancelledError:
-        await bot.highrise.chat(f"⏹️ {emote_name} loop cancelled for {username}")
-    except Exception as e:
-        await bot.highrise.chat(f"❌ Loop error: {e}")
-
 async def stoploop(bot: BaseBot, user: User, message: str) -> None:
     """Stop active emote loops - !stoploop [@target] or just 'stop'"""
+    parts = message.split(None, 2)
+    target_user_id = user.id
+    target_username = user.username
     try:
-        parts = message.split()
-        target_user_id = user.id
-        target_username = user.username
-        
         # Parse target if provided
         if len(parts) >= 2 and parts[1].startswith("@"):
             target_username_input = parts[1]
             
             # Check if user has permission to stop others' loops
-            is_privileged = (
-                user.id == getattr(bot, 'owner_id', None) or 
-                user.id in getattr(bot, 'hosts', []) or 
-                user.id in getattr(bot, 'vips', [])
-            )
-            
-            if not is_privileged:
+            if not is_privileged(bot, user):
                 await bot.highrise.chat("❌ Only owners, hosts, and VIPs can stop others' loops!")
                 return
             
@@ -614,7 +606,7 @@ async def stoploop(bot: BaseBot, user: User, message: str) -> None:
             target_username = target_username_input.replace("@", "")
         
         # Stop loops for this user
-        stopped = await stop_user_loop(bot, target_user_id, target_username)
+        stopped = stop_user_loop(bot, target_user_id, target_username)
         
         if stopped:
             await bot.highrise.chat(f"⏹️ Stopped emote loop for {target_username}")
@@ -627,7 +619,7 @@ async def stoploop(bot: BaseBot, user: User, message: str) -> None:
 async def stop(bot: BaseBot, user: User, message: str) -> None:
     """Universal stop command - stops any active loops for the user"""
     try:
-        stopped = await stop_user_loop(bot, user.id, user.username)
+        stopped = stop_user_loop(bot, user.id, user.username)
         
         if stopped:
             await bot.highrise.chat(f"⏹️ {user.username} stopped their emote loop")
@@ -14,7 +14,8 @@ from functions.equip import equip
 from functions.remove import remove
 from functions.emote_system import (
     emote, fight, hug, flirt, emotes, allemo, emo, single_emote,
-    loop, stoploop, numbers, number_emote, stop
+    loop, stoploop, numbers, number_emote, stop, invalidate_room_users,
+    find_user_by_username, find_room_user, get_room_users_cached
 )
 from functions.tipping_system import (
     tip_user, tip_all_users, tip_participants, check_wallet, tip_help
@@ -42,6 +43,9 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 logger.disabled = True  # Disable this logger completely
 
+# Plain-word chat commands worth logging (frozenset for O(1) membership)
+LOGGED_CHAT_WORDS = frozenset({"pop", "love", "help", "equip", "remove"})
+
 # Load environment variables
 load_dotenv()
 
@@ -72,43 +76,34 @@ class Bot(BaseBot):
         # Match Show registration data
         self.registration_sessions = {}  # Store ongoing registration sessions
         self.event_date = None  # Store the event date
-        self.hosts = []  # List of host user IDs
-        self.vips = []  # List of VIP user IDs
+        self.hosts = set()  # Host user IDs
+        self.vips = set()  # VIP user IDs
         self.subscribers = []  # List of users to remind when show starts
         
     async def initialize_services(self):
-        """Initialize database and services with retry logic"""
-        max_retries = 3
-        retry_delay = 5  # seconds
-        
-        for attempt in range(max_retries):
-            try:
-                print(f"🔗 Initializing database connection (attempt {attempt + 1}/{max_retries})...")
+        """Initialize database and services (initialize_db retries the connection itself)"""
+        try:
+            print("🔗 Initializing database connection...")
+            
+            # Initialize database
+            self.db_client = await initialize_db()
+            
+            if self.db_client and self.db_client.is_connected:
+                print("✅ Database connected successfully")
                 
-                # Initialize database
-                self.db_client = await initialize_db()
+                # Initialize matchmaking service
+                self.matchmaking = MatchmakingService(self.db_client)
                 
-                if self.db_client and self.db_client.is_connected:
-                    print("✅ Database connected successfully")
-                    
-                    # Initialize matchmaking service
-                    self.matchmaking = MatchmakingService(self.db_client)
-                    
-                    # Load hosts, VIPs, event date and subscribers from MongoDB
-                    await self.load_match_show_data()
-                    
-                    # Load bot position from MongoDB
-                    await self.load_bot_data()
-                    
-                    return True
-                    
-            except Exception as e:
-                print(f"❌ Database initialization error (attempt {attempt + 1}): {e}")
+                # Load hosts, VIPs, event date and subscribers from MongoDB
+                await self.load_match_show_data()
                 
-            if attempt < max_retries - 1:
-                print(f"Retrying database connection in {retry_delay} seconds...")
-                await asyncio.sleep(retry_delay)
-                retry_delay *= 2  # Exponential backoff
+                # Load bot position from MongoDB
+                await self.load_bot_data()
+                
+                return True
+                
+        except Exception as e:
+            print(f"❌ Database initialization error: {e}")
         
         print("⚠️ Database connection failed after all retries, using fallback mode")
         
@@ -124,23 +119,26 @@ class Bot(BaseBot):
         """Load Match Show data from MongoDB"""
         try:
             if self.db_client and self.db_client.is_connected:
+                # Load hosts, VIPs, event date and subscribers in one round trip
+                bot_data = await self.db_client.get_bot_singletons()
+                
                 # Load hosts
-                hosts_data = await self.db_client.bot_data.find_one({"data_type": "hosts"})
+                hosts_data = bot_data.get("hosts")
                 if hosts_data:
-                    self.hosts = hosts_data.get("user_ids", [])
+                    self.hosts = set(hosts_data.get("user_ids", []))
                     
                 # Load VIPs
-                vips_data = await self.db_client.bot_data.find_one({"data_type": "vips"})
+                vips_data = bot_data.get("vips")
                 if vips_data:
-                    self.vips = vips_data.get("user_ids", [])
+                    self.vips = set(vips_data.get("user_ids", []))
                     
                 # Load event date
-                event_data = await self.db_client.bot_data.find_one({"data_type": "event"})
+                event_data = bot_data.get("event")
                 if event_data:
                     self.event_date = event_data.get("date")
                     
                 # Load subscribers
-                subscribers_data = await self.db_client.bot_data.find_one({"data_type": "subscribers"})
+                subscribers_data = bot_data.get("subscribers")
                 if subscribers_data:
                     self.subscribers = subscribers_data.get("user_ids", [])
                     
@@ -183,13 +181,10 @@ class Bot(BaseBot):
         """
         # Try getting users in room first (this is the most reliable method)
         try:
-            response = await self.highrise.get_room_users()
-            # Check if response has content attribute (GetRoomUsersResponse)
-            if hasattr(response, 'content'):
-                room_users = response.content
-                for room_user, _ in room_users:
-                    if room_user.id == user_id:
-                        return room_user.username
+            # Shared short-lived snapshot - an empty list if the fetch failed
+            for room_user, _ in await get_room_users_cached(self):
+                if room_user.id == user_id:
+                    return room_user.username
         except Exception as e:
             pass
         
@@ -481,7 +476,8 @@ class Bot(BaseBot):
                 if self.db_client:
                     try:
                         # Simple ping to check if connection is alive
-                        await self.db_client.admin.command('ping')
+                        if not await self.db_client.ping():
+                            raise ConnectionError("MongoDB ping failed")
                         print(f"💊 Health check passed at {datetime.now()}")
                     except Exception as e:
                         print(f"⚠️ Database health check failed: {e}")
@@ -564,6 +560,7 @@ class Bot(BaseBot):
     async def on_user_join(self, user: User, position: Position | AnchorPosition) -> None:
         """Welcome users when they join"""
         logger.info(f"👋 User joined: @{user.username} (ID: {user.id})")
+        invalidate_room_users()  # Emote commands should see the new user right away
         
         try:
             await self.highrise.react("wave", user.id)
@@ -595,6 +592,7 @@ class Bot(BaseBot):
 
     async def on_user_leave(self, user: User) -> None:
         """Say goodbye when users leave"""
+        invalidate_room_users()
         await self.highrise.chat(f"Goodbye {user.username}! 👋 Hope you find your perfect match next time! 💖")
     
     async def on_disconnect(self) -> None:
@@ -680,11 +678,10 @@ class Bot(BaseBot):
         # Get user for permission checks
         user = None
         try:
-            room_users_resp = await self.highrise.get_room_users()
-            if hasattr(room_users_resp, 'content'):
-                user_tuple = next((u for u in room_users_resp.content if u[0].id == user_id), None)
-                if user_tuple:
-                    user = user_tuple[0]
+            room_users = await get_room_users_cached(self)
+            user_tuple = next((u for u in room_users if u[0].id == user_id), None)
+            if user_tuple:
+                user = user_tuple[0]
                 
             # Process the DM based on message content
             await self.process_direct_message(user, user_id, conversation_id, message)
@@ -753,11 +750,7 @@ class Bot(BaseBot):
                 self.subscribers.append(user_id)
                 # Save to database
                 if self.db_client and self.db_client.is_connected:
-                    await self.db_client.bot_data.update_one(
-                        {"data_type": "subscribers"},
-                        {"$set": {"user_ids": self.subscribers}},
-                        upsert=True
-                    )
+                    await self.db_client.save_subscribers(add=[user_id])
                 return "You've been added to the notification list! You'll receive a reminder when the Match Show starts."
             else:
                 return "You're already on the notification list!"
@@ -768,11 +761,7 @@ class Bot(BaseBot):
                 self.subscribers.remove(user_id)
                 # Save to database
                 if self.db_client and self.db_client.is_connected:
-                    await self.db_client.bot_data.update_one(
-                        {"data_type": "subscribers"},
-                        {"$set": {"user_ids": self.subscribers}},
-                        upsert=True
-                    )
+                    await self.db_client.save_subscribers(remove=[user_id])
                 return "You've been removed from the notification list. You will no longer receive Match Show reminders."
             else:
                 return "You are not currently subscribed to notifications."
@@ -988,11 +977,7 @@ class Bot(BaseBot):
                 self.subscribers.remove(user_id)
                 # Save to database
                 if self.db_client and self.db_client.is_connected:
-                    await self.db_client.bot_data.update_one(
-                        {"data_type": "subscribers"},
-                        {"$set": {"user_ids": self.subscribers}},
-                        upsert=True
-                    )
+                    await self.db_client.save_subscribers(remove=[user_id])
                 await self.highrise.send_message(
                     conversation_id, 
                     "You've been removed from the notification list. You will no longer receive Match Show reminders."
@@ -1743,7 +1728,7 @@ class Bot(BaseBot):
         lower_msg = message.lower().strip()
         
         # Log all chat commands for debugging
-        if lower_msg.startswith("!") or lower_msg in ["pop", "love", "help", "equip", "remove"]:
+        if lower_msg.startswith("!") or lower_msg in LOGGED_CHAT_WORDS:
             logger.info(f"💬 Command received: '{message}' from @{user.username} (ID: {user.id})")
         
         try:
@@ -1781,11 +1766,7 @@ class Bot(BaseBot):
                     # Save to database with error handling
                     try:
                         if self.db_client and self.db_client.is_connected:
-                            await self.db_client.bot_data.update_one(
-                                {"data_type": "subscribers"},
-                                {"$set": {"user_ids": self.subscribers}},
-                                upsert=True
-                            )
+                            await self.db_client.save_subscribers(remove=[user.id])
                     except Exception as db_error:
                         print(f"Database error in !unsub: {db_error}")
                         # Continue anyway - the user was removed from memory
@@ -1842,35 +1823,23 @@ class Bot(BaseBot):
                 if user.id == self.owner_id:
                     parts = message.split()
                     if len(parts) >= 2:
-                        host_username = parts[1].strip()
-                        # Get user ID from username
-                        response = await self.highrise.get_room_users()
-                        if isinstance(response, GetRoomUsersRequest.GetRoomUsersResponse):
-                            room_users = response.content
-                            host_id = None
-                            
-                            for room_user, _ in room_users:
-                                if room_user.username.lower() == host_username.lower():
-                                    host_id = room_user.id
-                                    break
-                            
-                            if host_id:
-                                if host_id not in self.hosts:
-                                    self.hosts.append(host_id)
-                                    
-                                    # Save to database
-                                    if self.db_client and self.db_client.is_connected:
-                                        await self.db_client.bot_data.update_one(
-                                            {"data_type": "hosts"},
-                                            {"$set": {"user_ids": self.hosts}},
-                                            upsert=True
-                                        )
-                                    
-                                    await self.highrise.chat(f"Added @{host_username} as a host!")
-                                else:
-                                    await self.highrise.chat(f"@{host_username} is already a host!")
+                        host_username = parts[1].strip().lstrip("@")
+                        # Get user ID from username (cached room snapshot, O(1) lookup)
+                        host_id = await find_user_by_username(self, host_username)
+                        
+                        if host_id:
+                            if host_id not in self.hosts:
+                                self.hosts.add(host_id)
+                                
+                                # Save to database
+                                if self.db_client and self.db_client.is_connected:
+                                    await self.db_client.save_hosts(add=[host_id])
+                                
+                                await self.highrise.chat(f"Added @{host_username} as a host!")
                             else:
-                                await self.highrise.chat(f"Could not find user @{host_username} in the room!")
+                                await self.highrise.chat(f"@{host_username} is already a host!")
+                        else:
+                            await self.highrise.chat(f"Could not find user @{host_username} in the room!")
                     else:
                         await self.highrise.chat("Usage: !addhost <username>")
                 else:
@@ -1882,32 +1851,20 @@ class Bot(BaseBot):
                 if user.id == self.owner_id:
                     parts = message.split()
                     if len(parts) >= 2:
-                        host_username = parts[1].strip()
-                        # Get user ID from username
-                        response = await self.highrise.get_room_users()
-                        if isinstance(response, GetRoomUsersRequest.GetRoomUsersResponse):
-                            room_users = response.content
-                            host_id = None
+                        host_username = parts[1].strip().lstrip("@")
+                        # Get user ID from username (cached room snapshot, O(1) lookup)
+                        host_id = await find_user_by_username(self, host_username)
+                        
+                        if host_id and host_id in self.hosts:
+                            self.hosts.discard(host_id)
                             
-                            for room_user, _ in room_users:
-                                if room_user.username.lower() == host_username.lower():
-                                    host_id = room_user.id
-                                    break
+                            # Save to database
+                            if self.db_client and self.db_client.is_connected:
+                                await self.db_client.save_hosts(remove=[host_id])
                             
-                            if host_id and host_id in self.hosts:
-                                self.hosts.remove(host_id)
-                                
-                                # Save to database
-                                if self.db_client and self.db_client.is_connected:
-                                    await self.db_client.bot_data.update_one(
-                                        {"data_type": "hosts"},
-                                        {"$set": {"user_ids": self.hosts}},
-                                        upsert=True
-                                    )
-                                
-                                await self.highrise.chat(f"Removed @{host_username} from hosts!")
-                            else:
-                                await self.highrise.chat(f"@{host_username} is not a host!")
+                            await self.highrise.chat(f"Removed @{host_username} from hosts!")
+                        else:
+                            await self.highrise.chat(f"@{host_username} is not a host!")
                     else:
                         await self.highrise.chat("Usage: !removehost <username>")
                 else:
@@ -1956,20 +1913,13 @@ class Bot(BaseBot):
                     
                     target_username = parts[1].strip()
                     
-                    # Get room users to verify username
+                    # Look the username up in the cached room snapshot
                     try:
-                        room_users_response = await self.highrise.get_room_users()
-                        if not isinstance(room_users_response, GetRoomUsersRequest.GetRoomUsersResponse):
-                            await self.highrise.chat("⚠️ Failed to get room users")
-                            return
-                        
-                        # Find user ID for the given username
                         target_user_id = None
-                        for room_user, _ in room_users_response.content:
-                            if room_user.username.lower() == target_username.lower():
-                                target_user_id = room_user.id
-                                target_username = room_user.username  # Use correct case
-                                break
+                        room_user = await find_room_user(self, target_username)
+                        if room_user:
+                            target_user_id = room_user.id
+                            target_username = room_user.username  # Use correct case
                         
                         # If not found in room, try to find in database
                         if not target_user_id and self.db_client and self.db_client.is_connected:
@@ -2315,7 +2265,7 @@ class Bot(BaseBot):
                 await allemo(self, user, message)
                 return
             
-            if lower_msg in ["!emo", "emo"]:
+            if lower_msg in ["!emo", "emo"] or lower_msg.startswith("!emo "):
                 await emo(self, user, message)
                 return
             
@@ -10,7 +10,7 @@ from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 import re
 from db.mongo_client import MongoDBClient
-from config import MATCH_PROMPT_INTERVAL, MIN_AGE
+from config import MATCH_PROMPT_INTERVAL, MIN_AGE, MATCH_PROMPTS
 
 # Define compatibility factors for matching
 COMPATIBILITY_FACTORS = ["age", "country", "continent"]
@@ -242,5 +242,4 @@ class MatchmakingService:
         
     async def get_random_match_prompt(self) -> str:
         """Get a random prompt to encourage matchmaking"""
-        from config import MATCH_PROMPTS
         return random.choice(MATCH_PROMPTS)
\ No newline at end of file
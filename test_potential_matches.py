@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test potential match lookup against the configured MongoDB
+Inserts a few throwaway profiles (including one whose looking_for is a
+list), checks which of them find_potential_matches returns, then
+removes them again.
+"""
+
+import asyncio
+import sys
+import uuid
+from datetime import datetime
+from dotenv import load_dotenv
+from db.mongo_client import MongoDBClient
+
+# Load environment variables
+load_dotenv()
+
+async def test_potential_matches():
+    """Check single-value and list looking_for profiles are matched"""
+    print("Potential Matches Test")
+    print("-" * 50)
+
+    mongo_client = MongoDBClient()
+    if not await mongo_client.connect():
+        print("\n❌ Failed to connect to MongoDB!")
+        return False
+
+    prefix = f"test_matches_{uuid.uuid4().hex[:8]}_"
+    # Far-future activity sorts the test profiles ahead of real ones
+    last_active = datetime(9999, 1, 1)
+    profiles = [
+        {"user_id": prefix + "seeker", "gender": "female", "looking_for": "male"},
+        {"user_id": prefix + "single", "gender": "male", "looking_for": "female"},
+        {"user_id": prefix + "list", "gender": "male", "looking_for": ["female", "male"]},
+        {"user_id": prefix + "any", "gender": "male", "looking_for": "any"},
+        {"user_id": prefix + "other", "gender": "male", "looking_for": ["male"]},
+    ]
+    for profile in profiles:
+        profile["last_active"] = last_active
+
+    try:
+        await mongo_client.profiles.insert_many(profiles)
+
+        matches = await mongo_client.find_potential_matches(prefix + "seeker", limit=20)
+        found = {m["user_id"] for m in matches if m["user_id"].startswith(prefix)}
+        expected = {prefix + "single", prefix + "list", prefix + "any"}
+
+        print(f"Expected: {sorted(expected)}")
+        print(f"Found:    {sorted(found)}")
+        if found == expected:
+            print("\n✅ Potential matches returned as expected")
+            return True
+        print("\n❌ Potential matches differ from expected")
+        return False
+    finally:
+        await mongo_client.profiles.delete_many({"user_id": {"$in": [p["user_id"] for p in profiles]}})
+        await mongo_client.disconnect()
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(test_potential_matches()) else 1)
@@ -91,25 +91,11 @@ def bot_status():
     """Detailed bot status for debugging"""
     # Import here to avoid circular imports
     try:
-        from db.init_db import initialize_db
-        import asyncio
+        from db.init_db import ping_shared_client
         
-        # Check database connection
-        async def check_db():
-            try:
-                client = await initialize_db()
-                if client:
-                    await client.disconnect()
-                    return True
-                return False
-            except:
-                return False
-        
-        # Run the async check
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        db_connected = loop.run_until_complete(check_db())
-        loop.close()
+        # Check the bot's own database connection (reuses its client and pool
+        # instead of opening a throwaway connection per request)
+        db_connected = ping_shared_client()
         
     except Exception as e:
         db_connected = False